@@ -6,6 +6,8 @@ All tuneable thresholds, schedules, demographic data, and warehouse
 settings live here so every module pulls from one source of truth.
 """
 
+import sys
+
 CONFIG = {
 
     # ─── Inventory Thresholds ───────────────────────────────────────
@@ -24,10 +26,10 @@ CONFIG = {
     "gui_delay":             0.05, # Seconds between customers (GUI sim)
 
     # ─── Week Schedule ─────────────────────────────────────────────
-    "day_names": [
+    "day_names": (
         "Monday", "Tuesday", "Wednesday", "Thursday",
         "Friday", "Saturday", "Sunday",
-    ],
+    ),
 
     "day_traffic": {
         "Monday":    0.90,   # 25 customers
@@ -63,7 +65,7 @@ CONFIG = {
         ],
     },
 
-    "delivery_days": ["Tuesday"],
+    "delivery_days": ("Tuesday",),
 
     # ─── Warehouse Stock (units per delivery per category) ─────────
     "warehouse_stock": {
@@ -256,7 +258,7 @@ CONFIG = {
     },
 
     # ─── Profession List (for random customer generation) ──────────
-    "professions": [
+    "professions": (
         "Teacher", "Nurse", "Software Engineer", "Electrician", "Accountant",
         "Chef", "Mechanic", "Pharmacist", "Graphic Designer", "Data Analyst",
         "Retail Manager", "Postman", "Receptionist", "Cashier", "Construction Worker",
@@ -265,10 +267,10 @@ CONFIG = {
         "Retired", "Freelancer", "Doctor", "Salesperson", "Warehouse Associate","Podcaster",
         "Stay-at-Home Parent", "Administrator", "Security Guard", "Police Officer","Lawyer",
         "Small Business Owner", "Artist", "Musician", "Scientist", "Athlete", "Coach", "Landscape Worker", "Veterinarian", "Flight Attendant", "Pilot", "Journalist", "Author",
-    ],
+    ),
 
     # ─── Customer Name Pools ───────────────────────────────────────
-    "first_names": [
+    "first_names": (
         "Chloe", "Temi", "Jazlyn", "Noah", "Jacque", "James", "Daniela", "Omar",
         "Diana", "Carolina", "Isabella", "Malhar", "Arafat", "Logan", "Jenicka",
         "Aiden", "Harper", "Elijah", "Angel", "Ben", "Grace", "Caleb",
@@ -279,19 +281,48 @@ CONFIG = {
         "Toure", "Rosa", "Tariq", "Simone", "Andrei", "Elisa", "Digna",
         "Elena", "Noel", "Valentina", "Raj", "Asia", "Jorge", "Bianca",
         "Mohammed", "Monique", "Jin", "Camila", "Charlie", "Leila","Markelis"
-    ],
+    ),
 
-    "last_names": [
+    "last_names": (
         "Smith", "Johnson", "Williams", "Brown", "Jones", "Garcia", "Miller",
         "Davis", "Martinez", "Lopez", "Wilson", "Anderson", "Thomas", "Tepic",
         "Lee", "Kim", "Toliver", "Patel", "Figueroa", "Wang", "Jackson", "Matthews",
         "Harris", "Howard", "Robinson", "Walker", "Hall", "Young", "King","Modi","Blackburn",
         "Wright", "Torres", "Rivera", "Evans", "Okafor", "Yamamoto", "Singh","Terry","Kirk", "Santiago",
         "Johansson", "Moore", "Alvarado", "Linjewile","McKnight", "Black","Craig"
-    ],
+    ),
 
-    "races": [
+    "races": (
         "White", "Black", "Hispanic", "Asian", "Arab",
         "Native American", "Pacific Islander", "Multiracial",
-    ],
+    ),
+}
+
+
+# ─── String Interning ─────────────────────────────────────────────
+# Day, category, profile, and profession names are used as dict keys
+# all over the app. Interning them once here means lookups from other
+# modules hit the identity fast path instead of comparing contents.
+
+def _intern_keys(mapping):
+    """Return a copy of mapping with every string key interned."""
+    return {sys.intern(key): value for key, value in mapping.items()}
+
+
+CONFIG["day_names"]           = tuple(map(sys.intern, CONFIG["day_names"]))
+CONFIG["delivery_days"]       = tuple(map(sys.intern, CONFIG["delivery_days"]))
+CONFIG["professions"]         = tuple(map(sys.intern, CONFIG["professions"]))
+CONFIG["races"]               = tuple(map(sys.intern, CONFIG["races"]))
+CONFIG["day_traffic"]         = _intern_keys(CONFIG["day_traffic"])
+CONFIG["high_traffic_blocks"] = _intern_keys(CONFIG["high_traffic_blocks"])
+CONFIG["warehouse_stock"]     = _intern_keys(CONFIG["warehouse_stock"])
+CONFIG["alcohol_age_rules"]   = _intern_keys(CONFIG["alcohol_age_rules"])
+CONFIG["alcohol_surge_rates"] = _intern_keys(CONFIG["alcohol_surge_rates"])
+CONFIG["profession_to_profile"] = {
+    sys.intern(profession): sys.intern(profile)
+    for profession, profile in CONFIG["profession_to_profile"].items()
 }
+CONFIG["shopper_profiles"]    = _intern_keys(CONFIG["shopper_profiles"])
+for _profile in CONFIG["shopper_profiles"].values():
+    _profile["category_weights"] = _intern_keys(_profile["category_weights"])
+del _profile
@@ -12,34 +12,56 @@ Provides a windowed interface with tabs for:
 """
 
 import tkinter as tk
-from tkinter import ttk, messagebox, scrolledtext
+from tkinter import ttk, messagebox, scrolledtext, font as tkfont
+import heapq
 import random
-import time
+from bisect import bisect_right
 import threading
-
-import matplotlib
-matplotlib.use("Agg")  # Non-interactive backend (render to image)
-import matplotlib.pyplot as plt
-from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
-from matplotlib.figure import Figure
+from collections import defaultdict, deque, namedtuple
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from functools import lru_cache
+from itertools import chain
 
 from config import CONFIG
 from inventory import (
-    seed_inventory, inventory, purchase, restock,
-    get_low_stock, get_total_value, get_all_products
+    seed_inventory, inventory, purchase, clear_inventory,
+    get_low_stock, get_total_value, get_total_quantity, get_low_stock_count,
+    get_all_products, get_category_index, get_inventory_version,
+    get_category_stock, adjust_stock, restock_many, set_price,
+    LOW_STOCK_THRESHOLD
 )
 from simulate_shopping import (
-    TIME_BLOCKS, SHOPPER_PROFILES, Customer,
+    SHOPPER_PROFILES, Customer,
     get_profile_for_time_block, pick_products_by_preference,
-    random_purchase_amount, DAY_NAMES, DAY_TRAFFIC,
-    DELIVERY_DAYS, WAREHOUSE_STOCK,
+    random_purchase_amount, DAY_NAMES, DAY_TRAFFIC_BY_INDEX,
+    DELIVERY_DAYS, IS_DELIVERY_DAY, WAREHOUSE_STOCK,
     friday_sale_suggestions, apply_sales,
     HIGH_STOCK_THRESHOLD, SALE_DISCOUNT,
     RESTOCK_TARGET, DELIVERY_RESTOCK_MAX,
-    ALCOHOL_SURGE_RATES, HIGH_TRAFFIC_BLOCKS
+    ALCOHOL_SURGE_RATES, DAY_BLOCK_PLANS
 )
 
 
+# ─── Lazy matplotlib ─────────────────────────────────────────────────
+# matplotlib and its Tk backend dominate GUI startup time but are only
+# needed once a chart is drawn, so they are imported on first use.
+
+@lru_cache(maxsize=None)
+def _load_matplotlib():
+    """Import matplotlib on first chart use.
+
+    Returns:
+        Tuple of (pyplot module, Figure class, FigureCanvasTkAgg class).
+    """
+    import matplotlib
+    matplotlib.use("Agg")  # Non-interactive backend (render to image)
+    import matplotlib.pyplot as plt
+    from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
+    from matplotlib.figure import Figure
+    return plt, Figure, FigureCanvasTkAgg
+
+
 # ─── Color Palette (Light Pastel) ────────────────────────────────────
 
 BG          = "#f5f0e6"      # Warm cream background
@@ -67,6 +89,106 @@ FONT_TITLE  = ("Courier New", 20, "bold")
 FONT_MONO   = ("Cascadia Mono", 10)
 FONT_SMALL  = ("Segoe UI", 9)
 
+# Rule lines for the simulation log and the daily report text
+LOG_RULE_EQ      = "=" * 58 + "\n"
+LOG_RULE_HASH    = "#" * 58 + "\n"
+REPORT_RULE_EQ   = "  " + "=" * 52 + "\n"
+REPORT_RULE_HASH = "  " + "#" * 52 + "\n"
+
+# Playback status text for each day's time blocks, indexed like DAY_BLOCK_PLANS
+BLOCK_STATUS_TEXT = tuple(
+    tuple(f"Day {day} | {label}" for label, _, _ in plans)
+    for day, plans in zip(DAY_NAMES, DAY_BLOCK_PLANS)
+)
+
+# Category stock-level bands: bisect_right(STOCK_LEVEL_BOUNDS, qty) gives
+# 0 = empty, 1 = under 30, 2 = under 100, 3 = well stocked
+STOCK_LEVEL_BOUNDS = (1, 30, 100)
+
+# ─── UI Timing ───────────────────────────────────────────────────────
+
+SEARCH_DEBOUNCE_MS = 120     # Wait for typing to pause before filtering
+LOG_FLUSH_MS       = 30      # Batch simulation log writes into one flush
+LOG_FLUSH_MAX      = 500     # Most log entries written per flush
+LOG_MAX_LINES      = 5000    # Oldest simulation log lines are dropped past this
+LOG_TRIM_LINES     = 500     # Extra lines dropped per trim so trims stay rare
+LOG_QUEUE_MAX      = 2 * LOG_MAX_LINES  # Queued entries kept (at most 2 per line)
+INV_RENDER_CHUNK   = 150     # Inventory rows inserted per event-loop turn
+BP_RESIZE_MS       = 80      # Redraw the blueprint once a resize settles
+UI_PUMP_MS         = 50      # Coalesce simulation-driven widget updates
+BP_FRAME_MS        = 100     # Live blueprint redraws are capped at 10 per second
+
+
+# ─── Widget Helpers ──────────────────────────────────────────────────
+
+def _merge_tag_runs(entries):
+    """Merge contiguous same-tag text into Text.insert() arguments.
+
+    Args:
+        entries: Iterable of (text, tag) pairs; tag may be None.
+
+    Returns:
+        Flat list of text, tags, text, tags, ... for a single insert() call.
+    """
+    chunks = []
+    run_tag, run = None, []
+    for text, tag in entries:
+        if tag != run_tag and run:
+            chunks += ("".join(run), (run_tag,) if run_tag else ())
+            run = []
+        run_tag = tag
+        run.append(text)
+    if run:
+        chunks += ("".join(run), (run_tag,) if run_tag else ())
+    return chunks
+
+
+# Treeview row tags are configured once per tree when it is built; rows only
+# reference them by name. The one-element tag tuples are shared as well, so
+# populate loops don't build a fresh tuple per row.
+ROW_TAGS = {name: (name,) for name in (
+    "low", "alt", "critical", "warn", "bought", "failed",
+    "day_node", "high_roller", "customer", "item_ok", "item_fail",
+)}
+ROW_TAGS[""] = ()
+
+
+@contextmanager
+def _suspend_redraw(tree, scrollbar=None):
+    """Hide a Treeview's columns (and unhook its scrollbar) during bulk edits.
+
+    With no visible columns and no scroll callback, Tk skips the per-row
+    layout and scroll-position work, so inserting many rows costs one
+    re-layout when the block exits rather than one per row.
+
+    Args:
+        tree:      The ttk.Treeview being repopulated.
+        scrollbar: Optional Scrollbar wired to the tree's yscrollcommand.
+    """
+    shown = tree["displaycolumns"]
+    if scrollbar is None:
+        tree.configure(displaycolumns=())
+    else:
+        tree.configure(displaycolumns=(), yscrollcommand="")
+    try:
+        yield tree
+    finally:
+        if scrollbar is None:
+            tree.configure(displaycolumns=shown)
+        else:
+            tree.configure(displaycolumns=shown, yscrollcommand=scrollbar.set)
+
+
+# ─── History Records ───────────────────────────────────────────────
+
+# One per simulated shopper, kept for the history tab. A named tuple is far
+# smaller than the equivalent dict and its fields read as attributes. cart
+# holds plain (product_name, qty, unit_price, subtotal, success) tuples.
+CustomerRecord = namedtuple("CustomerRecord", (
+    "num", "name", "profession", "profile", "age", "race",
+    "total", "items_count", "cart",
+))
+
 
 # ─── Main Application ──────────────────────────────────────────────
 
@@ -81,10 +203,39 @@ class MiniMeijerApp:
         self.root.minsize(900, 600)
 
         # Simulation data storage
-        self.sim_log = []            # List of log strings
         self.report_data = None      # Dict of report stats
         self.sim_running = False
         self.sim_speed = tk.IntVar(value=10)  # Speed level 1-20 (10 = default)
+        self._sim_speed_value = 10    # Copy of sim_speed the worker thread reads
+        self.sim_speed.trace_add("write", self._on_speed_changed)
+        self._search_after_id = None  # Pending debounced search refresh
+        self._inv_sorted_cache = None # (product, name_lc, category_lc) rows
+        self._inv_cache_dirty = True  # Rebuild the cache on next refresh
+        self._inv_table_sig = None    # (inventory version, search) last drawn
+        self._inv_row_values = []     # (values, is_low) per sorted-cache row
+        self._inv_values_version = None  # Inventory version _inv_row_values match
+        self._inv_render_id = None    # Pending after() id for the next row chunk
+        self._inv_rows = {}           # Product id -> (values, tags) of its row item
+        self._low_stock_sig = None    # Inventory version last drawn
+        self._low_rows = {}           # product id -> (values, tags) on screen
+        self._rendered_report = None  # report_data the report tab shows
+        # Pending (text, tag) log writes; entries old enough to be trimmed
+        # from the widget anyway are dropped if the queue backs up
+        self._log_queue = deque(maxlen=LOG_QUEUE_MAX)
+        self._log_lock = threading.Lock()
+        self._log_flush_pending = False
+        self._pending_updates = {}    # UI update key -> latest value, see _ui_pump
+        self._update_lock = threading.Lock()
+        self._update_pump_pending = False
+
+        # Single reusable worker for simulation runs + a cancel token it polls
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="sim")
+        self._cancel_event = threading.Event()
+        # Set by the sale / surge popups once answered; the worker blocks on
+        # them instead of polling. Closing the window sets them too.
+        self._sale_event = threading.Event()
+        self._alcohol_surge_event = threading.Event()
+        self.root.protocol("WM_DELETE_WINDOW", self._on_close)
 
         # Style configuration
         self._setup_styles()
@@ -96,18 +247,66 @@ class MiniMeijerApp:
         self.notebook = ttk.Notebook(self.root, style="Dark.TNotebook")
         self.notebook.pack(fill=tk.BOTH, expand=True, padx=10, pady=(0, 0))
 
-        # Build each tab
+        # Build each tab. Tabs that are only refreshed after a run get an
+        # empty frame now and are populated the first time they are selected;
+        # after that they skip refreshes while hidden and catch up when shown.
+        self._lazy_tabs = {}          # tab frame path -> (frame, builder)
+        self._tab_refreshers = {}     # tab frame path -> refresh run when shown
+        self.wh_total_label = None    # Set once the warehouse tab is built
+        self.low_tree = None          # Set once the low stock tab is built
+        self.report_inner = None      # Set once the report tab is built
+        self._chart_widgets = []      # Chart canvases, kept so they aren't GC'd
         self._build_blueprint_tab()
         self._build_inventory_tab()
         self._build_simulation_tab()
-        self._build_warehouse_tab()
+        self._wh_tab = self._add_lazy_tab("  Warehouse  ", self._build_warehouse_tab,
+                                          self._refresh_warehouse_tab)
         self._build_activity_tab()
-        self._build_low_stock_tab()
-        self._build_report_tab()
+        self._low_tab = self._add_lazy_tab("  Low Stock  ", self._build_low_stock_tab,
+                                           self._refresh_low_stock)
+        self._report_tab = self._add_lazy_tab("  Report  ", self._build_report_tab,
+                                              self._refresh_report_tab)
+        self.notebook.bind("<<NotebookTabChanged>>", self._on_tab_changed)
 
         # Bottom inventory status bar
         self._build_bottom_bar()
 
+    # ─── Lazy Tabs ─────────────────────────────────────────────────
+
+    def _add_lazy_tab(self, text, builder, refresh):
+        """Add an empty tab whose contents are built on first selection.
+
+        Args:
+            text:    Tab label shown in the notebook.
+            builder: Callable taking the tab frame and populating it.
+            refresh: Callable bringing the built tab up to date; run each
+                     time the tab is shown, since it skips hidden refreshes.
+
+        Returns:
+            The tab's frame.
+        """
+        frame = tk.Frame(self.notebook, bg=BG)
+        self.notebook.add(frame, text=text)
+        self._lazy_tabs[str(frame)] = (frame, builder)
+        self._tab_refreshers[str(frame)] = refresh
+        return frame
+
+    def _tab_shown(self, frame):
+        """Return True if the given tab frame is the selected notebook tab."""
+        return str(self.notebook.select()) == str(frame)
+
+    def _on_tab_changed(self, event=None):
+        """Build the selected tab on first view, or catch it up afterwards."""
+        key = str(self.notebook.select())
+        pending = self._lazy_tabs.pop(key, None)
+        if pending:
+            frame, builder = pending
+            builder(frame)
+            return
+        refresh = self._tab_refreshers.get(key)
+        if refresh:
+            refresh()
+
     # ─── Styles ─────────────────────────────────────────────────────
 
     def _setup_styles(self):
@@ -227,6 +426,14 @@ class MiniMeijerApp:
         )
         self.speed_slider.pack(side=tk.LEFT, padx=(4, 0))
 
+    def _on_speed_changed(self, *args):
+        """Copy the speed slider's value where the simulation thread reads it.
+
+        The worker paces itself off this plain attribute instead of calling
+        sim_speed.get(), so it never touches a Tk variable off the main thread.
+        """
+        self._sim_speed_value = self.sim_speed.get()
+
     # ─── Tab 1: Store Blueprint ─────────────────────────────────────
 
     # Blueprint colour constants (light pastel)
@@ -239,42 +446,108 @@ class MiniMeijerApp:
     BP_ENTRANCE = "#eae5d9"
     BP_AISLE    = "#e0dbd0"
     BP_WALL     = "#d5d0c4"
+    BP_GRID_STEP = 25           # Blueprint grid spacing in pixels
+
+    # Center aisles, left to right: (left shelf, right shelf) categories
+    BP_AISLES = (
+        ("Beverages",  "Pantry"),
+        ("Snacks",     "Frozen"),
+        ("Household",  "Desserts"),
+    )
+
+    # (fill, text colour) per STOCK_LEVEL_BOUNDS band
+    BP_STOCK_COLORS = (
+        ("#fde8e8", RED),
+        ("#fef3e0", RED),
+        ("#fef9e7", YELLOW),
+        (BP_SECTION, GREEN),
+    )
 
     def _build_blueprint_tab(self):
         """Build the store blueprint floor plan tab."""
         frame = tk.Frame(self.notebook, bg=self.BP_BG)
         self.notebook.add(frame, text="  Store Map  ")
+        self._bp_tab = frame
+        self._tab_refreshers[str(frame)] = self._refresh_blueprint
 
         self.bp_canvas = tk.Canvas(frame, bg=self.BP_BG, highlightthickness=0)
         self.bp_canvas.pack(fill=tk.BOTH, expand=True)
 
+        # Canvas size as last reported by <Configure>; read by _refresh_blueprint
+        self._bp_size = (0, 0)
+        self._bp_resize_id = None   # Pending debounced resize redraw
+        self._bp_frame_id = None    # Pending throttled live redraw
+        self._bp_drawn_sig = None   # (size, inventory version) last drawn
+        self._bp_drawn_size = None  # Canvas size the current items were laid out for
+        self._bp_sections = []      # (category, rect, qty, count, count_fmt) item ids
+
+        # One grid cell (lines on its top and left edges), tiled into a
+        # canvas-sized background image instead of drawing each grid line
+        step = self.BP_GRID_STEP
+        self._bp_grid_tile = tk.PhotoImage(width=step, height=step)
+        self._bp_grid_tile.put(self.BP_GRID, to=(0, 0, step, 1))
+        self._bp_grid_tile.put(self.BP_GRID, to=(0, 0, 1, step))
+        self._bp_grid_bg = None     # Tiled grid image for the current size
+        self._bp_fonts = {}         # (size, weight) -> shared tkfont.Font
+
         # Redraw on resize
-        self.bp_canvas.bind("<Configure>", lambda e: self._refresh_blueprint())
+        self.bp_canvas.bind("<Configure>", self._on_blueprint_configure)
+
+    def _on_blueprint_configure(self, event):
+        """Cache the blueprint canvas size and redraw once resizing settles."""
+        self._bp_size = (event.width, event.height)
+        if self._bp_resize_id is not None:
+            self.root.after_cancel(self._bp_resize_id)
+        self._bp_resize_id = self.root.after(BP_RESIZE_MS, self._run_blueprint_resize)
+
+    def _run_blueprint_resize(self):
+        """Fire the debounced redraw queued by _on_blueprint_configure."""
+        self._bp_resize_id = None
+        self._refresh_blueprint()
+
+    def _schedule_blueprint_refresh(self):
+        """Redraw the blueprint on the next frame, at most once per BP_FRAME_MS.
 
-    def _get_category_stock(self, category):
-        """Return (total_qty, num_products) for a category."""
-        prods = [e.value for e in inventory.all_entries()
-                 if e.value.category == category]
-        return sum(p.quantity for p in prods), len(prods)
+        Stock changes during a run mark the plan stale through here; any
+        further changes before the frame fires are picked up by that one
+        redraw.
+        """
+        if self._bp_frame_id is None:
+            self._bp_frame_id = self.root.after(BP_FRAME_MS, self._run_blueprint_frame)
+
+    def _run_blueprint_frame(self):
+        """Fire the throttled redraw queued by _schedule_blueprint_refresh."""
+        self._bp_frame_id = None
+        self._refresh_blueprint()
+
+    def _bp_font(self, size, weight="normal"):
+        """Return a shared blueprint font, creating it on first use.
+
+        Passing one Font object to every canvas item saves Tk from parsing
+        and resolving a font description tuple for each item it draws.
+
+        Args:
+            size:   Point size.
+            weight: "normal" or "bold".
+        """
+        key = (size, weight)
+        font = self._bp_fonts.get(key)
+        if font is None:
+            font = self._bp_fonts[key] = tkfont.Font(
+                family="Cascadia Mono", size=size, weight=weight)
+        return font
 
     def _stock_color(self, total_qty):
         """Return (fill_colour, text_colour) based on stock level."""
-        if total_qty == 0:
-            return "#fde8e8", RED
-        elif total_qty < 30:
-            return "#fef3e0", RED
-        elif total_qty < 100:
-            return "#fef9e7", YELLOW
-        else:
-            return self.BP_SECTION, GREEN
+        return self.BP_STOCK_COLORS[bisect_right(STOCK_LEVEL_BOUNDS, total_qty)]
 
     def _draw_section(self, canvas, x, y, w, h, category, vertical_text=False):
         """Draw a single store section box with live stock data."""
-        total_qty, num_items = self._get_category_stock(category)
+        total_qty, num_items = get_category_stock(category)
         fill, qty_color = self._stock_color(total_qty)
 
-        canvas.create_rectangle(x, y, x + w, y + h,
-                                fill=fill, outline=self.BP_BORDER, width=1.5)
+        rect = canvas.create_rectangle(x, y, x + w, y + h,
+                                       fill=fill, outline=self.BP_BORDER, width=1.5)
 
         cx, cy = x + w / 2, y + h / 2
 
@@ -283,47 +556,79 @@ class MiniMeijerApp:
             canvas.create_text(cx, cy - h * 0.25,
                                text=category.upper(),
                                fill=self.BP_TEXT,
-                               font=("Cascadia Mono", 8, "bold"))
-            canvas.create_text(cx, cy,
-                               text=str(total_qty),
-                               fill=qty_color,
-                               font=("Cascadia Mono", 16, "bold"))
-            canvas.create_text(cx, cy + h * 0.20,
-                               text=f"{num_items}p",
-                               fill=self.BP_DIM,
-                               font=("Cascadia Mono", 7))
+                               font=self._bp_font(8, "bold"))
+            qty = canvas.create_text(cx, cy,
+                                     text=str(total_qty),
+                                     fill=qty_color,
+                                     font=self._bp_font(16, "bold"))
+            count_fmt = "{}p"
+            count = canvas.create_text(cx, cy + h * 0.20,
+                                       text=count_fmt.format(num_items),
+                                       fill=self.BP_DIM,
+                                       font=self._bp_font(7))
         else:
             # Horizontal layout
             name_size = 8 if len(category) > 10 else 9
             canvas.create_text(cx, cy - h * 0.28,
                                text=category.upper(),
                                fill=self.BP_TEXT,
-                               font=("Cascadia Mono", name_size, "bold"))
+                               font=self._bp_font(name_size, "bold"))
             qty_size = 14 if w < 120 else 18
-            canvas.create_text(cx, cy + h * 0.02,
-                               text=str(total_qty),
-                               fill=qty_color,
-                               font=("Cascadia Mono", qty_size, "bold"))
-            canvas.create_text(cx, cy + h * 0.30,
-                               text=f"{num_items} products",
-                               fill=self.BP_DIM,
-                               font=("Cascadia Mono", 7))
+            qty = canvas.create_text(cx, cy + h * 0.02,
+                                     text=str(total_qty),
+                                     fill=qty_color,
+                                     font=self._bp_font(qty_size, "bold"))
+            count_fmt = "{} products"
+            count = canvas.create_text(cx, cy + h * 0.30,
+                                       text=count_fmt.format(num_items),
+                                       fill=self.BP_DIM,
+                                       font=self._bp_font(7))
+
+        # Remember the live items so stock changes can update them in place
+        self._bp_sections.append((category, rect, qty, count, count_fmt))
+
+    def _update_sections(self, canvas):
+        """Update section colours and counts in place from current stock."""
+        for category, rect, qty, count, count_fmt in self._bp_sections:
+            total_qty, num_items = get_category_stock(category)
+            fill, qty_color = self._stock_color(total_qty)
+            canvas.itemconfig(rect, fill=fill)
+            canvas.itemconfig(qty, text=str(total_qty), fill=qty_color)
+            canvas.itemconfig(count, text=count_fmt.format(num_items))
 
     def _refresh_blueprint(self):
-        """Redraw a realistic grocery store floor plan."""
+        """Redraw a realistic grocery store floor plan.
+
+        Skipped while the Store Map tab is hidden (it redraws when shown),
+        and when neither the canvas size nor the inventory has changed
+        since the last draw, since the plan shows nothing else. If only the
+        stock changed, the existing section items are updated in place; the
+        whole plan is only rebuilt when the canvas size changes.
+        """
+        if not self._tab_shown(self._bp_tab):
+            return
+        sig = (self._bp_size, get_inventory_version())
+        if sig == self._bp_drawn_sig:
+            return
+        self._bp_drawn_sig = sig
+
         canvas = self.bp_canvas
+        if self._bp_size == self._bp_drawn_size and self._bp_sections:
+            self._update_sections(canvas)
+            return
+        self._bp_drawn_size = self._bp_size
+        self._bp_sections = []
         canvas.delete("all")
 
-        W = canvas.winfo_width()
-        H = canvas.winfo_height()
+        W, H = self._bp_size
         if W < 400 or H < 350:
             return
 
         # ── Blueprint grid ─────────────────────────────────────────
-        for gx in range(0, W, 25):
-            canvas.create_line(gx, 0, gx, H, fill=self.BP_GRID)
-        for gy in range(0, H, 25):
-            canvas.create_line(0, gy, W, gy, fill=self.BP_GRID)
+        grid = tk.PhotoImage(width=W, height=H)
+        grid.tk.call(grid, "copy", self._bp_grid_tile, "-to", 0, 0, W, H)
+        self._bp_grid_bg = grid  # Canvas doesn't hold a reference
+        canvas.create_image(0, 0, image=grid, anchor=tk.NW)
 
         # ── Geometry ───────────────────────────────────────────────
         M = 25                            # margin
@@ -349,7 +654,7 @@ class MiniMeijerApp:
         canvas.create_text(W / 2, M + title_h / 2,
                            text="MINI MEIJER \u2014 STORE FLOOR PLAN",
                            fill=self.BP_TEXT,
-                           font=("Cascadia Mono", 13, "bold"))
+                           font=self._bp_font(13, "bold"))
 
         # ── Store outer walls ──────────────────────────────────────
         canvas.create_rectangle(sx, sy, sx + sw, sy + sh,
@@ -368,7 +673,7 @@ class MiniMeijerApp:
         # Wall label
         canvas.create_text(sx + sw / 2, sy - 8,
                            text="\u2500\u2500 BACK WALL (fresh departments) \u2500\u2500",
-                           fill=self.BP_DIM, font=("Cascadia Mono", 7))
+                           fill=self.BP_DIM, font=self._bp_font(7))
 
         # --- LEFT WALL: Dairy (full height of inner area) ---
         self._draw_section(canvas, sx, sy + wall_d,
@@ -381,32 +686,23 @@ class MiniMeijerApp:
         # Side labels
         canvas.create_text(sx - 8, sy + wall_d + inner_h / 2,
                            text="DAIRY WALL", fill=self.BP_DIM,
-                           font=("Cascadia Mono", 7), angle=90)
+                           font=self._bp_font(7), angle=90)
         canvas.create_text(sx + sw + 8, sy + wall_d + inner_h / 2,
                            text="ALCOHOL WALL", fill=self.BP_DIM,
-                           font=("Cascadia Mono", 7), angle=90)
+                           font=self._bp_font(7), angle=90)
 
         # ══════════════════════════════════════════════════════════
         #  CENTER AISLES
         # ══════════════════════════════════════════════════════════
 
-        # 3 aisles in the center, each with a category on each side
-        # Aisle 1: Beverages | Pantry
-        # Aisle 2: Snacks    | Frozen
-        # Aisle 3: Household | Kitchen Appliances + Desserts
-        aisle_count = 3
+        # One aisle per BP_AISLES entry, each with a category on each side
+        aisle_count = len(self.BP_AISLES)
         aisle_total_w = inner_w
         aisle_unit = aisle_total_w / aisle_count
         shelf_w = (aisle_unit - aisle_gap) / 2
         aisle_h = inner_h - 6  # slight padding
 
-        aisle_defs = [
-            ("Beverages",  "Pantry"),
-            ("Snacks",     "Frozen"),
-            ("Household",  "Desserts"),
-        ]
-
-        for i, (left_cat, right_cat) in enumerate(aisle_defs):
+        for i, (left_cat, right_cat) in enumerate(self.BP_AISLES):
             ax = inner_x + i * aisle_unit
             ay = inner_y + 3
 
@@ -421,14 +717,14 @@ class MiniMeijerApp:
             canvas.create_text(lane_x + aisle_gap / 2, ay + aisle_h / 2,
                                text=f"AISLE {i + 1}",
                                fill=self.BP_DIM,
-                               font=("Cascadia Mono", 6, "bold"), angle=90)
+                               font=self._bp_font(6, "bold"), angle=90)
             # Arrow indicators
             canvas.create_text(lane_x + aisle_gap / 2, ay + 10,
                                text="\u25BC", fill=self.BP_DIM,
-                               font=("Cascadia Mono", 8))
+                               font=self._bp_font(8))
             canvas.create_text(lane_x + aisle_gap / 2, ay + aisle_h - 10,
                                text="\u25B2", fill=self.BP_DIM,
-                               font=("Cascadia Mono", 8))
+                               font=self._bp_font(8))
 
             # Right shelf
             self._draw_section(canvas, lane_x + aisle_gap, ay,
@@ -445,7 +741,7 @@ class MiniMeijerApp:
         # Endcap label
         canvas.create_text(endcap_x + endcap_w / 2, endcap_y - 7,
                            text="\u25C6 ENDCAP",
-                           fill=YELLOW, font=("Cascadia Mono", 6, "bold"))
+                           fill=YELLOW, font=self._bp_font(6, "bold"))
 
         # ══════════════════════════════════════════════════════════
         #  CHECKOUT ZONE (bottom of store)
@@ -458,7 +754,7 @@ class MiniMeijerApp:
         canvas.create_text(sx + sw * 0.12, ck_y + ck_h / 2,
                            text="CHECKOUT",
                            fill=self.BP_TEXT,
-                           font=("Cascadia Mono", 10, "bold"))
+                           font=self._bp_font(10, "bold"))
 
         # Checkout lanes
         lane_count = 6
@@ -474,7 +770,7 @@ class MiniMeijerApp:
             canvas.create_text(lx + lw / 2, ck_y + ck_h / 2,
                                text=str(i + 1),
                                fill=self.BP_DIM,
-                               font=("Cascadia Mono", 9, "bold"))
+                               font=self._bp_font(9, "bold"))
 
         # Customer service desk
         cs_x = sx + sw * 0.82
@@ -483,7 +779,7 @@ class MiniMeijerApp:
                                 width=1)
         canvas.create_text((cs_x + sx + sw - 4) / 2, ck_y + ck_h / 2,
                            text="SERVICE\nDESK",
-                           fill=self.BP_TEXT, font=("Cascadia Mono", 7, "bold"),
+                           fill=self.BP_TEXT, font=self._bp_font(7, "bold"),
                            justify=tk.CENTER)
 
         # ── Entrance door (bottom wall, centered) ──────────────────
@@ -494,7 +790,7 @@ class MiniMeijerApp:
         canvas.create_text(door_x + entrance_w / 2, door_y + 14,
                            text="\u25B2  ENTRANCE / EXIT  \u25B2",
                            fill=self.BP_TEXT,
-                           font=("Cascadia Mono", 10, "bold"))
+                           font=self._bp_font(10, "bold"))
 
         # ── Legend ─────────────────────────────────────────────────
         lg_y = sy + sh + 26
@@ -508,10 +804,40 @@ class MiniMeijerApp:
                                     fill=color, outline="")
             canvas.create_text(bx + 18, lg_y + 6, text=label,
                                fill=self.BP_DIM,
-                               font=("Cascadia Mono", 8), anchor=tk.W)
+                               font=self._bp_font(8), anchor=tk.W)
 
     # ─── Tab 3: Inventory ───────────────────────────────────────────
 
+    # (column id, heading, width, anchor). Widths are fixed here and applied
+    # once at build time; refreshes only delete/insert rows, never touching
+    # column() or heading(), which would force a full tree re-layout.
+    INV_COLUMNS = (
+        ("id",       "Product ID", 110, tk.W),
+        ("name",     "Name",       200, tk.W),
+        ("price",    "Price",      90,  tk.E),
+        ("qty",      "Quantity",   90,  tk.E),
+        ("category", "Category",   120, tk.W),
+    )
+
+    @staticmethod
+    def _make_table(parent, columns, height):
+        """Create a headings-only Treeview from a column spec.
+
+        Args:
+            parent:  Widget to place the table in.
+            columns: Tuple of (column id, heading, width, anchor) rows.
+            height:  Visible row count.
+
+        Returns:
+            The configured ttk.Treeview.
+        """
+        tree = ttk.Treeview(parent, columns=tuple(c[0] for c in columns),
+                            show="headings", style="Dark.Treeview", height=height)
+        for col, heading, width, anchor in columns:
+            tree.heading(col, text=heading)
+            tree.column(col, width=width, anchor=anchor)
+        return tree
+
     def _build_inventory_tab(self):
         """Build the inventory table tab with search."""
         frame = tk.Frame(self.notebook, bg=BG)
@@ -525,7 +851,7 @@ class MiniMeijerApp:
                  bg=BG, fg=FG).pack(side=tk.LEFT)
 
         self.search_var = tk.StringVar()
-        self.search_var.trace_add("write", lambda *a: self._refresh_inventory_table())
+        self.search_var.trace_add("write", lambda *a: self._schedule_inventory_refresh())
         search_entry = tk.Entry(search_frame, textvariable=self.search_var,
                                 font=FONT, bg=BG_CARD, fg=FG,
                                 insertbackground=FG, relief=tk.SOLID,
@@ -540,27 +866,18 @@ class MiniMeijerApp:
                   ).pack(side=tk.RIGHT)
 
         # Treeview table
-        cols = ("id", "name", "price", "qty", "category")
-        self.inv_tree = ttk.Treeview(frame, columns=cols, show="headings",
-                                      style="Dark.Treeview", height=22)
-        self.inv_tree.heading("id",       text="Product ID")
-        self.inv_tree.heading("name",     text="Name")
-        self.inv_tree.heading("price",    text="Price")
-        self.inv_tree.heading("qty",      text="Quantity")
-        self.inv_tree.heading("category", text="Category")
-
-        self.inv_tree.column("id",       width=110, anchor=tk.W)
-        self.inv_tree.column("name",     width=200, anchor=tk.W)
-        self.inv_tree.column("price",    width=90,  anchor=tk.E)
-        self.inv_tree.column("qty",      width=90,  anchor=tk.E)
-        self.inv_tree.column("category", width=120, anchor=tk.W)
+        self.inv_tree = self._make_table(frame, self.INV_COLUMNS, height=22)
+
+        # Row tags never change, so configure them once here
+        self.inv_tree.tag_configure("low", foreground=RED)
+        self.inv_tree.tag_configure("alt", background=ROW_ALT)
 
         # Scrollbar
-        scrollbar = ttk.Scrollbar(frame, orient=tk.VERTICAL, command=self.inv_tree.yview)
-        self.inv_tree.configure(yscrollcommand=scrollbar.set)
+        self.inv_scrollbar = ttk.Scrollbar(frame, orient=tk.VERTICAL, command=self.inv_tree.yview)
+        self.inv_tree.configure(yscrollcommand=self.inv_scrollbar.set)
 
         self.inv_tree.pack(side=tk.LEFT, fill=tk.BOTH, expand=True, padx=(10, 0), pady=(0, 10))
-        scrollbar.pack(side=tk.RIGHT, fill=tk.Y, pady=(0, 10), padx=(0, 10))
+        self.inv_scrollbar.pack(side=tk.RIGHT, fill=tk.Y, pady=(0, 10), padx=(0, 10))
 
     # ─── Tab 3: Simulation Log ──────────────────────────────────────
 
@@ -603,10 +920,20 @@ class MiniMeijerApp:
         "Alcohol":            "\U0001F37A",  # beer
     }
 
-    def _build_warehouse_tab(self):
-        """Build the warehouse tab with a grid of box-icon category cards."""
-        frame = tk.Frame(self.notebook, bg=BG)
-        self.notebook.add(frame, text="  Warehouse  ")
+    # (badge colour, badge text) per STOCK_LEVEL_BOUNDS band
+    WH_STOCK_LEVELS = (
+        (RED,    "OUT"),
+        (RED,    "LOW"),
+        (YELLOW, "OK"),
+        (GREEN,  "FULL"),
+    )
+
+    def _build_warehouse_tab(self, frame):
+        """Build the warehouse tab with a grid of box-icon category cards.
+
+        Args:
+            frame: The (empty) notebook tab frame to populate.
+        """
 
         # Header row
         top = tk.Frame(frame, bg=BG)
@@ -682,6 +1009,12 @@ class MiniMeijerApp:
         # Chart view
         self.dr_chart_frame = tk.Frame(self.dr_container, bg=BG)
         self.dr_chart_frame.pack(fill=tk.BOTH, expand=True)
+        self.dr_placeholder = tk.Label(
+            self.dr_chart_frame,
+            text="No daily reports yet. Run a simulation to see charts.",
+            font=FONT, bg=BG, fg=FG_DIM)
+        self._dr_canvas = None  # Reused FigureCanvasTkAgg, created on first chart
+        self._dr_drawn_for = False  # report_data the daily reports show (False: none yet)
 
         # Text view
         self.dr_text_frame = tk.Frame(self.dr_container, bg=BG)
@@ -700,47 +1033,22 @@ class MiniMeijerApp:
         self.delivery_text.tag_config("info", foreground=ACCENT)
 
         # Initial populate
-        self._refresh_warehouse()
-        self._draw_daily_report_chart()
+        self._wh_cards = None  # category -> card widgets, built on first refresh
+        self._refresh_warehouse_tab()
 
-    def _refresh_warehouse(self):
-        """Refresh the warehouse grid with box-icon category cards."""
-        # Clear old cards
-        for widget in self.wh_grid_inner.winfo_children():
-            widget.destroy()
+    def _build_warehouse_cards(self):
+        """Create one box-icon card per warehouse category.
 
-        total_units = 0
-        categories = list(WAREHOUSE_STOCK.items())
+        Returns:
+            Dict of category -> the card widgets _refresh_warehouse updates.
+        """
+        cards = {}
         cols = 4  # 4 columns in the grid
 
-        for i, (category, units) in enumerate(categories):
+        for i, (category, units) in enumerate(WAREHOUSE_STOCK.items()):
             row, col = divmod(i, cols)
-
-            products_in_cat = [
-                e.value for e in inventory.all_entries()
-                if e.value.category == category
-            ]
-            num_products = len(products_in_cat)
-            per_product = units // num_products if num_products > 0 else 0
-            total_units += units
-
             icon = self.WH_ICONS.get(category, "\U0001F4E6")
 
-            # Stock level color
-            store_qty = sum(p.quantity for p in products_in_cat)
-            if store_qty == 0:
-                level_color = RED
-                level_text = "OUT"
-            elif store_qty < 30:
-                level_color = RED
-                level_text = "LOW"
-            elif store_qty < 100:
-                level_color = YELLOW
-                level_text = "OK"
-            else:
-                level_color = GREEN
-                level_text = "FULL"
-
             # Build card
             card = tk.Frame(self.wh_grid_inner, bg=BG_CARD,
                             padx=12, pady=10, relief=tk.FLAT,
@@ -766,29 +1074,77 @@ class MiniMeijerApp:
             left.pack(side=tk.LEFT, fill=tk.X, expand=True)
             tk.Label(left, text=f"{units} units", font=FONT_BOLD,
                      bg=BG_CARD, fg=FG).pack(anchor=tk.W)
-            tk.Label(left, text=f"{num_products} products", font=FONT_SMALL,
-                     bg=BG_CARD, fg=FG_DIM).pack(anchor=tk.W)
-            tk.Label(left, text=f"{per_product} ea.", font=FONT_SMALL,
-                     bg=BG_CARD, fg=FG_DIM).pack(anchor=tk.W)
+            products_label = tk.Label(left, font=FONT_SMALL, bg=BG_CARD, fg=FG_DIM)
+            products_label.pack(anchor=tk.W)
+            per_product_label = tk.Label(left, font=FONT_SMALL, bg=BG_CARD, fg=FG_DIM)
+            per_product_label.pack(anchor=tk.W)
 
             # Right column: stock status badge
             right = tk.Frame(stats_frame, bg=BG_CARD)
             right.pack(side=tk.RIGHT)
-            badge = tk.Frame(right, bg=level_color, padx=8, pady=3)
+            badge = tk.Frame(right, padx=8, pady=3)
             badge.pack(padx=(0, 4), pady=4)
-            tk.Label(badge, text=level_text, font=("Segoe UI", 8, "bold"),
-                     bg=level_color, fg="#ffffff").pack()
-            tk.Label(right, text=f"{store_qty} in store",
-                     font=("Segoe UI", 8), bg=BG_CARD, fg=FG_DIM).pack()
+            badge_label = tk.Label(badge, font=("Segoe UI", 8, "bold"), fg="#ffffff")
+            badge_label.pack()
+            store_label = tk.Label(right, font=("Segoe UI", 8), bg=BG_CARD, fg=FG_DIM)
+            store_label.pack()
+
+            cards[category] = {
+                "products":    products_label,
+                "per_product": per_product_label,
+                "badge":       badge,
+                "badge_label": badge_label,
+                "store":       store_label,
+            }
 
         # Configure grid columns to expand evenly
         for c in range(cols):
             self.wh_grid_inner.columnconfigure(c, weight=1)
 
+        return cards
+
+    def _refresh_warehouse(self):
+        """Refresh the warehouse grid with box-icon category cards.
+
+        The cards are built on the first call and updated in place after
+        that, rather than destroying and recreating every widget.
+        """
+        if self.wh_total_label is None or not self._tab_shown(self._wh_tab):
+            return  # Not built yet, or hidden; refreshed when next shown
+        if self._wh_cards is None:
+            self._wh_cards = self._build_warehouse_cards()
+
+        total_units = 0
+        for category, units in WAREHOUSE_STOCK.items():
+            store_qty, num_products = get_category_stock(category)
+            per_product = units // num_products if num_products > 0 else 0
+            total_units += units
+
+            # Stock level color
+            level_color, level_text = self.WH_STOCK_LEVELS[
+                bisect_right(STOCK_LEVEL_BOUNDS, store_qty)]
+
+            card = self._wh_cards[category]
+            card["products"].config(text=f"{num_products} products")
+            card["per_product"].config(text=f"{per_product} ea.")
+            card["badge"].config(bg=level_color)
+            card["badge_label"].config(text=level_text, bg=level_color)
+            card["store"].config(text=f"{store_qty} in store")
+
         self.wh_total_label.config(text=f"Total per delivery: {total_units} units")
 
+    def _refresh_warehouse_tab(self):
+        """Refresh the warehouse cards and the daily reports section."""
+        self._refresh_warehouse()
+        self._refresh_delivery_history()
+
     def _refresh_delivery_history(self):
         """Update the daily reports section with per-day summaries."""
+        if self.wh_total_label is None or not self._tab_shown(self._wh_tab):
+            return  # Not built yet, or hidden; refreshed when next shown
+        if self.report_data is self._dr_drawn_for:
+            return  # Already showing these reports
+        self._dr_drawn_for = self.report_data
         dt = self.delivery_text
         dt.configure(state=tk.NORMAL)
         dt.delete("1.0", tk.END)
@@ -805,6 +1161,10 @@ class MiniMeijerApp:
         week_delivered = 0
         week_restocked = 0
 
+        # Collect (text, tag) lines and write them with a single insert
+        lines = []
+        add = lines.append
+
         for rpt in reports:
             day = rpt["day"]
             rev = rpt["revenue"]
@@ -822,32 +1182,34 @@ class MiniMeijerApp:
             week_delivered += delivered
             week_restocked += restocked
 
-            dt.insert(tk.END, f"  {'=' * 52}\n", "dim")
-            dt.insert(tk.END, f"  {day.upper()} -- End-of-Day Report\n", "header")
-            dt.insert(tk.END, f"  {'=' * 52}\n", "dim")
-            dt.insert(tk.END, f"  Customers:      {cust}\n", "info")
-            dt.insert(tk.END, f"  Items Sold:     {items}\n", "info")
-            dt.insert(tk.END, f"  Revenue:        ${rev:,.2f}\n", "success")
+            add((REPORT_RULE_EQ, "dim"))
+            add((f"  {day.upper()} -- End-of-Day Report\n", "header"))
+            add((REPORT_RULE_EQ, "dim"))
+            add((f"  Customers:      {cust}\n", "info"))
+            add((f"  Items Sold:     {items}\n", "info"))
+            add((f"  Revenue:        ${rev:,.2f}\n", "success"))
             if failed > 0:
-                dt.insert(tk.END, f"  Failed Buys:    {failed}\n", "error")
+                add((f"  Failed Buys:    {failed}\n", "error"))
             if delivered > 0:
-                dt.insert(tk.END, f"  Delivery:       +{delivered} units\n", "warning")
+                add((f"  Delivery:       +{delivered} units\n", "warning"))
             if restocked > 0:
-                dt.insert(tk.END, f"  Overnight Restock: +{restocked} units\n", "warning")
-            dt.insert(tk.END, f"  Inventory Value: ${inv_val:,.2f}\n", "dim")
+                add((f"  Overnight Restock: +{restocked} units\n", "warning"))
+            add((f"  Inventory Value: ${inv_val:,.2f}\n", "dim"))
             if low_count > 0:
-                dt.insert(tk.END, f"  Low Stock Items: {low_count}\n", "error")
-            dt.insert(tk.END, "\n")
+                add((f"  Low Stock Items: {low_count}\n", "error"))
+            add(("\n", None))
 
         # Weekly totals
-        dt.insert(tk.END, f"  {'#' * 52}\n", "header")
-        dt.insert(tk.END, f"  WEEKLY TOTALS\n", "header")
-        dt.insert(tk.END, f"  {'#' * 52}\n", "header")
-        dt.insert(tk.END, f"  Total Customers:   {week_cust}\n", "info")
-        dt.insert(tk.END, f"  Total Items Sold:  {week_items}\n", "info")
-        dt.insert(tk.END, f"  Total Revenue:     ${week_rev:,.2f}\n", "success")
-        dt.insert(tk.END, f"  Total Delivered:   {week_delivered} units\n", "warning")
-        dt.insert(tk.END, f"  Total Restocked:   {week_restocked} units\n", "warning")
+        add((REPORT_RULE_HASH, "header"))
+        add(("  WEEKLY TOTALS\n", "header"))
+        add((REPORT_RULE_HASH, "header"))
+        add((f"  Total Customers:   {week_cust}\n", "info"))
+        add((f"  Total Items Sold:  {week_items}\n", "info"))
+        add((f"  Total Revenue:     ${week_rev:,.2f}\n", "success"))
+        add((f"  Total Delivered:   {week_delivered} units\n", "warning"))
+        add((f"  Total Restocked:   {week_restocked} units\n", "warning"))
+
+        dt.insert(tk.END, *_merge_tag_runs(lines))
 
         dt.configure(state=tk.DISABLED)
 
@@ -872,15 +1234,16 @@ class MiniMeijerApp:
             self._draw_daily_report_chart()
 
     def _draw_daily_report_chart(self):
-        """Draw a grouped bar chart of daily metrics in the warehouse tab."""
-        # Clear old chart
-        for w in self.dr_chart_frame.winfo_children():
-            w.destroy()
+        """Draw a grouped bar chart of daily metrics in the warehouse tab.
 
+        One Figure and Tk canvas are created on first use and reused after
+        that: each redraw clears and repopulates the figure instead of
+        destroying the widget and building a new figure and canvas.
+        """
         if not self.report_data or not self.report_data.get("daily_reports"):
-            tk.Label(self.dr_chart_frame,
-                     text="No daily reports yet. Run a simulation to see charts.",
-                     font=FONT, bg=BG, fg=FG_DIM).pack(pady=30)
+            if self._dr_canvas is not None:
+                self._dr_canvas.get_tk_widget().pack_forget()
+            self.dr_placeholder.pack(pady=30)
             return
 
         reports = self.report_data["daily_reports"]
@@ -890,10 +1253,17 @@ class MiniMeijerApp:
         items = [r["items_sold"] for r in reports]
 
         import numpy as np
+        _, Figure, FigureCanvasTkAgg = _load_matplotlib()
         x = np.arange(len(days))
         width = 0.28
 
-        fig = Figure(figsize=(10, 4.5), dpi=100)
+        if self._dr_canvas is None:
+            fig = Figure(figsize=(10, 4.5), dpi=100)
+            self._dr_canvas = FigureCanvasTkAgg(fig, master=self.dr_chart_frame)
+            self._dr_canvas.get_tk_widget().configure(height=350, bg=BG)
+        else:
+            fig = self._dr_canvas.figure
+            fig.clear()
         fig.patch.set_facecolor(BG)
 
         # ── Top chart: Revenue bar + Customer line overlay ──
@@ -961,7 +1331,9 @@ class MiniMeijerApp:
                    labelcolor=FG_DIM)
 
         fig.tight_layout(pad=1.5)
-        self._embed_chart(self.dr_chart_frame, fig, height=350)
+        self.dr_placeholder.pack_forget()
+        self._dr_canvas.get_tk_widget().pack(fill=tk.X, padx=15, pady=(0, 10))
+        self._dr_canvas.draw_idle()
 
     # ─── Tab 5: Customer Activity ─────────────────────────────────
 
@@ -1074,6 +1446,11 @@ class MiniMeijerApp:
 
         self.act_tree.pack(fill=tk.BOTH, expand=True, pady=(4, 0))
 
+        # Cart rows are pooled: each customer rebinds and reattaches existing
+        # items instead of deleting and inserting new ones
+        self._act_rows = []       # Every cart row item id ever created
+        self._act_rows_used = 0   # How many of them the current cart shows
+
         # ════════════════════════════════════════════════════════════
         # BOTTOM HALF: Customer history log (expandable by day)
         # ════════════════════════════════════════════════════════════
@@ -1105,17 +1482,21 @@ class MiniMeijerApp:
         self.hist_tree.tag_configure("item_ok",    foreground=GREEN)
         self.hist_tree.tag_configure("item_fail",  foreground=RED)
 
-        hist_scroll = ttk.Scrollbar(history_frame, orient=tk.VERTICAL,
-                                    command=self.hist_tree.yview)
+        self.hist_scroll = hist_scroll = ttk.Scrollbar(
+            history_frame, orient=tk.VERTICAL, command=self.hist_tree.yview)
         self.hist_tree.configure(yscrollcommand=hist_scroll.set)
 
         self.hist_tree.pack(side=tk.LEFT, fill=tk.BOTH, expand=True,
                             pady=(6, 0))
         hist_scroll.pack(side=tk.RIGHT, fill=tk.Y, pady=(6, 0))
+        self.hist_tree.bind("<<TreeviewOpen>>", self._on_hist_expand)
 
-        # Storage for per-day customer records built during simulation
-        self._day_customers_log = []  # list of dicts per customer
+        # History bookkeeping, reset by _clear_history at the start of a run
         self._hist_day_nodes = {}     # day_name -> treeview node id
+        # Collapsed nodes whose children are only inserted when first opened:
+        # node id -> ("day", customer_records) or ("customer", cart). Entries
+        # are dropped once inserted, so the tree then holds the only copy.
+        self._hist_pending = {}
 
     def _update_activity_customer(self, customer, profile_name, customer_num, day_name, block_label):
         """Update the activity panel with a new customer (called on main thread)."""
@@ -1126,23 +1507,61 @@ class MiniMeijerApp:
         self.act_race.config(text=customer.race)
         self.act_total.config(text="$0.00")
         self.act_items_count.config(text="0")
-        self.act_tree.delete(*self.act_tree.get_children())
+        if self._act_rows_used:
+            self.act_tree.detach(*self._act_rows[:self._act_rows_used])
+            self._act_rows_used = 0
         self.activity_status.config(
             text=f"{day_name} | {block_label}", fg=ACCENT
         )
 
     def _update_activity_item(self, product_name, qty, unit_price, subtotal, success):
         """Add an item row to the activity cart table (called on main thread)."""
+        tree = self.act_tree
         tag = "bought" if success else "failed"
         status = "Purchased" if success else "Out of Stock"
-        self.act_tree.insert("", tk.END, values=(
-            product_name, qty, f"${unit_price:.2f}",
-            f"${subtotal:.2f}" if success else "--", status
-        ), tags=(tag,))
-        # Auto-scroll to bottom
-        children = self.act_tree.get_children()
-        if children:
-            self.act_tree.see(children[-1])
+        values = (product_name, qty, f"${unit_price:.2f}",
+                  f"${subtotal:.2f}" if success else "--", status)
+
+        # Reuse a detached row from an earlier cart when one is free
+        used = self._act_rows_used
+        if used < len(self._act_rows):
+            iid = self._act_rows[used]
+            tree.item(iid, values=values, tags=ROW_TAGS[tag])
+            tree.move(iid, "", tk.END)
+        else:
+            iid = tree.insert("", tk.END, values=values, tags=ROW_TAGS[tag])
+            self._act_rows.append(iid)
+        self._act_rows_used = used + 1
+
+    def _show_customer_activity(self, customer, profile_name, customer_num,
+                                day_name, block_label, cart, total, items):
+        """Show a served customer and their whole cart (called on main thread).
+
+        Posted once per customer through the UI pump, so a burst of fast
+        customers only redraws the panel for the latest one.
+
+        Args:
+            customer:     The Customer that was served.
+            profile_name: Their shopper profile.
+            customer_num: Running customer number for the week.
+            day_name:     Day the customer shopped.
+            block_label:  Time block the customer shopped in.
+            cart:         List of (name, qty, unit_price, subtotal, success).
+            total:        Amount the customer spent.
+            items:        Units the customer bought.
+        """
+        # The old cart is detached and the new one attached in one layout pass
+        with _suspend_redraw(self.act_tree):
+            self._update_activity_customer(customer, profile_name,
+                                           customer_num, day_name, block_label)
+            for line in cart:
+                self._update_activity_item(*line)
+        self._update_activity_totals(total, items)
+
+        # Scroll once, to the last cart row
+        used = self._act_rows_used
+        if used:
+            self.act_tree.see(self._act_rows[used - 1])
 
     def _update_activity_totals(self, total, items):
         """Update the running cart total and item count (called on main thread)."""
@@ -1150,82 +1569,126 @@ class MiniMeijerApp:
         self.act_items_count.config(text=str(items))
 
     def _add_history_day(self, day_name, day_index, customer_records):
-        """Populate the history tree with a full day of customers.
+        """Add a day of customers to the history tree.
 
-        Called on main thread at the end of each sim day.
-        customer_records: list of dicts with keys:
-            num, name, profession, profile, age, race, total, items_count, cart
+        Called on main thread at the end of each sim day. Only the day
+        node is inserted here; _on_hist_expand fills in its customers.
+        customer_records: list of CustomerRecord
         cart: list of (product_name, qty, unit_price, subtotal, success)
         """
-        # Find the high roller for this day
-        high_roller_idx = -1
-        high_roller_total = -1
-        for i, rec in enumerate(customer_records):
-            if rec["total"] > high_roller_total:
-                high_roller_total = rec["total"]
-                high_roller_idx = i
-
-        # Reorder so the high roller appears first
-        if high_roller_idx > 0:
-            hr = customer_records.pop(high_roller_idx)
-            customer_records.insert(0, hr)
-            high_roller_idx = 0
+        # Day totals in one pass over the records
+        day_total = 0
+        day_items = 0
+        for rec in customer_records:
+            day_total += rec.total
+            day_items += rec.items_count
 
         # Day node
         day_count = len(customer_records)
-        day_total = sum(r["total"] for r in customer_records)
         day_id = self.hist_tree.insert(
             "", tk.END,
             text=f"\U0001F4C5  {day_name} ({day_count} customers)",
             values=(f"Day {day_index + 1}",
                     f"${day_total:,.2f}",
-                    sum(r["items_count"] for r in customer_records)),
-            open=False, tags=("day_node",)
+                    day_items),
+            open=False, tags=ROW_TAGS["day_node"]
         )
         self._hist_day_nodes[day_name] = day_id
 
-        # Customer nodes under the day
-        for i, rec in enumerate(customer_records):
-            is_high_roller = (i == high_roller_idx)
-            tag = "high_roller" if is_high_roller else "customer"
-            prefix = "\U0001F451 " if is_high_roller else ""
-            suffix = "  \u2605 HIGH ROLLER" if is_high_roller else ""
+        # Customer nodes are inserted when the day is first expanded
+        self._defer_hist_children(day_id, "day", customer_records)
+
+        # Auto-scroll to latest day
+        self.hist_tree.see(day_id)
+
+    def _defer_hist_children(self, node, kind, children):
+        """Give a history node a placeholder child until it is first opened.
+
+        Args:
+            node:     Treeview id of the day or customer node.
+            kind:     "day" (children are customer records) or "customer"
+                      (children are cart tuples).
+            children: The records to insert when the node is expanded.
+        """
+        if not children:
+            return
+        self.hist_tree.insert(node, tk.END, text="\u2026")
+        self._hist_pending[node] = (kind, children)
+
+    def _on_hist_expand(self, event=None):
+        """Replace an opened node's placeholder with its real children."""
+        tree = self.hist_tree
+        node = tree.focus()
+        pending = self._hist_pending.pop(node, None)
+        if pending is None:
+            return
+        kind, children = pending
+        tree.delete(*tree.get_children(node))
+
+        if kind == "day":
+            # The day's high roller (first top spender) is listed first,
+            # then everyone else in arrival order
+            hr_idx, hr_rec = max(enumerate(children), key=lambda t: t[1].total)
+            ordered = chain((hr_rec,),
+                            (r for j, r in enumerate(children) if j != hr_idx))
+            with _suspend_redraw(tree, self.hist_scroll):
+                for i, rec in enumerate(ordered):
+                    is_high_roller = (i == 0)
+                    tag = "high_roller" if is_high_roller else "customer"
+                    prefix = "\U0001F451 " if is_high_roller else ""
+                    suffix = "  \u2605 HIGH ROLLER" if is_high_roller else ""
+
+                    cust_id = tree.insert(
+                        node, tk.END,
+                        text=f"{prefix}#{rec.num}  {rec.name}{suffix}",
+                        values=(
+                            f"{rec.profession} | {rec.profile} | Age {rec.age}",
+                            f"${rec.total:,.2f}",
+                            rec.items_count
+                        ),
+                        open=False, tags=ROW_TAGS[tag]
+                    )
+                    self._defer_hist_children(cust_id, "customer", rec.cart)
+            return
 
-            cust_id = self.hist_tree.insert(
-                day_id, tk.END,
-                text=f"{prefix}#{rec['num']}  {rec['name']}{suffix}",
+        # Item children under a customer
+        for item_name, qty, price, subtotal, success in children:
+            itag = "item_ok" if success else "item_fail"
+            status = "Purchased" if success else "Out of Stock"
+            tree.insert(
+                node, tk.END,
+                text=f"    {item_name}",
                 values=(
-                    f"{rec['profession']} | {rec['profile']} | Age {rec['age']}",
-                    f"${rec['total']:,.2f}",
-                    rec["items_count"]
+                    status,
+                    f"${subtotal:.2f}" if success else "--",
+                    qty
                 ),
-                open=False, tags=(tag,)
+                tags=ROW_TAGS[itag]
             )
 
-            # Item children under each customer
-            for item_name, qty, price, subtotal, success in rec["cart"]:
-                itag = "item_ok" if success else "item_fail"
-                status = "Purchased" if success else "Out of Stock"
-                self.hist_tree.insert(
-                    cust_id, tk.END,
-                    text=f"    {item_name}",
-                    values=(
-                        status,
-                        f"${subtotal:.2f}" if success else "--",
-                        qty
-                    ),
-                    tags=(itag,)
-                )
-
-        # Auto-scroll to latest day
-        self.hist_tree.see(day_id)
+    def _clear_history(self):
+        """Remove every history node and any children still pending."""
+        with _suspend_redraw(self.hist_tree, self.hist_scroll) as tree:
+            tree.delete(*tree.get_children())
+        self._hist_pending.clear()
+        self._hist_day_nodes.clear()
 
     # ─── Tab 6: Low Stock ─────────────────────────────────────────
 
-    def _build_low_stock_tab(self):
-        """Build the low stock alerts tab."""
-        frame = tk.Frame(self.notebook, bg=BG)
-        self.notebook.add(frame, text="  Low Stock  ")
+    # (column id, heading, width, anchor); see INV_COLUMNS
+    LOW_COLUMNS = (
+        ("id",       "Product ID", 110, tk.W),
+        ("name",     "Name",       220, tk.W),
+        ("qty",      "Quantity",   100, tk.E),
+        ("category", "Category",   140, tk.W),
+    )
+
+    def _build_low_stock_tab(self, frame):
+        """Build the low stock alerts tab.
+
+        Args:
+            frame: The (empty) notebook tab frame to populate.
+        """
 
         # Top bar with auto-restock button
         top = tk.Frame(frame, bg=BG)
@@ -1240,27 +1703,24 @@ class MiniMeijerApp:
                   ).pack(side=tk.RIGHT)
 
         # Table
-        cols = ("id", "name", "qty", "category")
-        self.low_tree = ttk.Treeview(frame, columns=cols, show="headings",
-                                      style="Dark.Treeview", height=15)
-        self.low_tree.heading("id",       text="Product ID")
-        self.low_tree.heading("name",     text="Name")
-        self.low_tree.heading("qty",      text="Quantity")
-        self.low_tree.heading("category", text="Category")
-
-        self.low_tree.column("id",       width=110, anchor=tk.W)
-        self.low_tree.column("name",     width=220, anchor=tk.W)
-        self.low_tree.column("qty",      width=100, anchor=tk.E)
-        self.low_tree.column("category", width=140, anchor=tk.W)
+        self.low_tree = self._make_table(frame, self.LOW_COLUMNS, height=15)
+
+        # Row tags never change, so configure them once here
+        self.low_tree.tag_configure("critical", foreground=RED)
+        self.low_tree.tag_configure("warn", foreground=YELLOW)
 
         self.low_tree.pack(fill=tk.BOTH, expand=True, padx=10, pady=(0, 10))
 
+        self._refresh_low_stock()
+
     # ─── Tab 7: Report ──────────────────────────────────────────────
 
-    def _build_report_tab(self):
-        """Build the report tab with a scrollable canvas for charts."""
-        frame = tk.Frame(self.notebook, bg=BG)
-        self.notebook.add(frame, text="  Report  ")
+    def _build_report_tab(self, frame):
+        """Build the report tab with a scrollable canvas for charts.
+
+        Args:
+            frame: The (empty) notebook tab frame to populate.
+        """
 
         # Scrollable container
         self.report_canvas = tk.Canvas(frame, bg=BG, highlightthickness=0)
@@ -1296,8 +1756,13 @@ class MiniMeijerApp:
         )
         self.report_placeholder.pack(pady=40)
 
-        # Keep references to chart canvases so they aren't garbage-collected
-        self._chart_widgets = []
+        # A run may have finished before the tab was first opened
+        self._refresh_report_tab()
+
+    def _refresh_report_tab(self):
+        """Render the latest report, if there is one."""
+        if self.report_data:
+            self._build_report_text(self.report_data)
 
     def _on_report_canvas_resize(self, event):
         """Stretch the inner frame to match the canvas width."""
@@ -1352,12 +1817,15 @@ class MiniMeijerApp:
         self.bb_status.pack(side=tk.RIGHT, padx=(0, 8))
 
     def _refresh_bottom_bar(self):
-        """Update the bottom bar with current inventory totals."""
-        products = [e.value for e in inventory.all_entries()]
-        total_products = len(products)
-        total_units = sum(p.quantity for p in products)
-        total_value = sum(p.price * p.quantity for p in products)
-        low_count = len([p for p in products if p.quantity <= 10])
+        """Update the bottom bar with current inventory totals.
+
+        Every figure comes from the inventory's running totals, so this
+        costs the same however many products are stocked.
+        """
+        total_products = inventory.count
+        total_units = get_total_quantity()
+        total_value = get_total_value()
+        low_count = get_low_stock_count()
 
         self.bb_products.config(text=str(total_products))
         self.bb_units.config(text=f"{total_units:,}")
@@ -1369,13 +1837,12 @@ class MiniMeijerApp:
 
     def _load_inventory(self):
         """Seed the inventory and refresh the table."""
-        # Clear existing inventory first
-        for entry in list(inventory.all_entries()):
-            inventory.delete(entry.key)
-        inventory.count = 0
+        # Clear existing inventory (and its category index) first
+        clear_inventory()
 
         # Redirect print to capture log
         seed_inventory()
+        self._inv_cache_dirty = True
         self._refresh_inventory_table()
         self._refresh_low_stock()
         self._refresh_blueprint()
@@ -1395,50 +1862,98 @@ class MiniMeijerApp:
         self.run_btn.configure(text="Running...", bg=FG_DIM, state=tk.DISABLED)
 
         # Clear previous log
+        with self._log_lock:
+            self._log_queue.clear()
         self.sim_text.configure(state=tk.NORMAL)
         self.sim_text.delete("1.0", tk.END)
         self.sim_text.configure(state=tk.DISABLED)
 
-        thread = threading.Thread(target=self._run_simulation, daemon=True)
-        thread.start()
+        self._cancel_event.clear()
+        future = self._executor.submit(self._run_simulation)
+        future.add_done_callback(self._on_simulation_done)
+
+    def _on_simulation_done(self, future):
+        """Hand a finished simulation run back to the Tk thread.
+
+        Runs on the worker thread. Cancelled runs (window closing) are
+        dropped; failed runs are logged and the run controls re-enabled.
+        """
+        if self._cancel_event.is_set():
+            return
+        error = future.exception()
+        if error is not None:
+            self._log(f"\n  [X] Simulation stopped: {error}\n", "error")
+            self.root.after(0, self._reset_run_controls)
+            return
+        self.root.after(0, self._update_after_simulation)
+
+    def _on_close(self):
+        """Cancel any running simulation, then close the window."""
+        self._cancel_event.set()
+        self._sale_event.set()            # Wake a worker waiting on a popup
+        self._alcohol_surge_event.set()
+        self._executor.shutdown(wait=False, cancel_futures=True)
+        self.root.destroy()
 
     def _run_simulation(self):
         """Run the full 7-day weekly simulation on a background thread."""
+        # Log lines are buffered locally and handed to the log queue in one
+        # batch at each flush point (per customer, before popups, per day)
+        pending_log = []
+
+        def log(text, tag=None):
+            pending_log.append((text, tag))
+
+        def flush_log():
+            self._log_many(pending_log)
+            pending_log.clear()
+
+        # Bind hot-loop callables to locals once
+        after = self.root.after
+        buy = purchase
+        roll_qty = random_purchase_amount
+        cancelled = self._cancel_event.is_set
+        post_update = self._post_update
+        # Pacing waits on the cancel token, so closing the window wakes the
+        # worker at once instead of after the rest of the delay
+        pause = self._cancel_event.wait
+        new_profile = get_profile_for_time_block
+        pick_cart = pick_products_by_preference
+
         value_before = get_total_value()
 
         # Reset playback progress
-        self.root.after(0, lambda: self.bb_progress.configure(value=0))
-        self.root.after(0, lambda: self.bb_status.config(
-            text="Simulation Running...", fg=YELLOW))
+        post_update("progress", 0)
+        post_update("status", ("Simulation Running...", YELLOW))
 
-        self._log("=" * 58 + "\n", "header")
-        self._log("  Mini Meijer -- 7-Day Weekly Simulation\n", "header")
-        self._log("=" * 58 + "\n\n", "header")
-        self._log(f"  Starting inventory value: ${value_before:,.2f}\n", "info")
-        self._log(f"  Deliveries scheduled: {', '.join(DELIVERY_DAYS)}\n\n", "dim")
+        log(LOG_RULE_EQ, "header")
+        log("  Mini Meijer -- 7-Day Weekly Simulation\n", "header")
+        log(LOG_RULE_EQ + "\n", "header")
+        log(f"  Starting inventory value: ${value_before:,.2f}\n", "info")
+        log(f"  Deliveries scheduled: {', '.join(DELIVERY_DAYS)}\n\n", "dim")
 
         week_items_sold = 0
         week_revenue = 0.0
         week_failed = 0
         week_customers = 0
-        sales_by_product = {}
+        sales_by_product = defaultdict(int)
         low_stock_hits = set()
-        sales_by_time_block = {}
+        sales_by_time_block = defaultdict(float)
         sales_by_day = {}
         customers_by_day = {}
         deliveries_log = []
         sale_suggestions_applied = []
         customer_num = 0
-        profile_counts = {}
+        profile_counts = defaultdict(int)
 
         daily_reports = []
 
         # Clear customer history from any previous run
-        self.root.after(0, lambda: self.hist_tree.delete(*self.hist_tree.get_children()))
-        self._hist_day_nodes = {}
+        after(0, self._clear_history)
 
         for day_index, day_name in enumerate(DAY_NAMES):
-            traffic = DAY_TRAFFIC[day_name]
+            traffic = DAY_TRAFFIC_BY_INDEX[day_index]
+            day_status = BLOCK_STATUS_TEXT[day_index]
             day_revenue = 0.0
             day_customers = 0
             day_items_sold = 0
@@ -1446,21 +1961,21 @@ class MiniMeijerApp:
             day_delivered = 0
             day_customer_records = []  # for history log
 
-            self._log("\n" + "#" * 58 + "\n", "header")
-            self._log(f"  DAY {day_index + 1}: {day_name.upper()}  "
-                      f"(traffic: {traffic}x)\n", "header")
-            self._log("#" * 58 + "\n", "header")
+            log("\n" + LOG_RULE_HASH, "header")
+            log(f"  DAY {day_index + 1}: {day_name.upper()}  "
+                f"(traffic: {traffic}x)\n", "header")
+            log(LOG_RULE_HASH, "header")
 
             # ── Delivery truck ──────────────────────────────────────
-            if day_name in DELIVERY_DAYS:
-                self._log(f"\n  DELIVERY TRUCK -- {day_name} Morning\n", "warning")
-                self._log(f"  (Only restocking items with {DELIVERY_RESTOCK_MAX} or fewer units)\n", "dim")
+            if IS_DELIVERY_DAY[day_index]:
+                log(f"\n  DELIVERY TRUCK -- {day_name} Morning\n", "warning")
+                log(f"  (Only restocking items with {DELIVERY_RESTOCK_MAX} or fewer units)\n", "dim")
                 total_delivered = 0
+                by_category = get_category_index()
                 for category, units in WAREHOUSE_STOCK.items():
                     products_in_cat = [
-                        e.value for e in inventory.all_entries()
-                        if e.value.category == category
-                            and e.value.quantity <= DELIVERY_RESTOCK_MAX
+                        p for p in by_category.get(category, ())
+                        if p.quantity <= DELIVERY_RESTOCK_MAX
                     ]
                     if not products_in_cat:
                         continue
@@ -1469,132 +1984,129 @@ class MiniMeijerApp:
                     for i, p in enumerate(products_in_cat):
                         amount = per_product + (1 if i < remainder else 0)
                         if amount > 0:
-                            p.quantity += amount
+                            adjust_stock(p, amount)
                             total_delivered += amount
-                            self._log(f"    [OK] +{amount} {p.name} "
-                                      f"(now {p.quantity})\n", "success")
+                            log(f"    [OK] +{amount} {p.name} "
+                                f"(now {p.quantity})\n", "success")
                 day_delivered = total_delivered
                 deliveries_log.append((day_name, total_delivered))
-                self._log(f"  [OK] Delivery complete: {total_delivered} units\n", "info")
+                log(f"  [OK] Delivery complete: {total_delivered} units\n", "info")
 
             # ── Friday sale suggestions (popup in GUI) ──────────────
             if day_name == "Friday":
                 suggestions = friday_sale_suggestions()
                 if suggestions:
-                    self._log(f"\n  FRIDAY SALE -- TOP {len(suggestions)} "
-                              f"OVERSTOCKED ITEMS\n", "warning")
+                    log(f"\n  FRIDAY SALE -- TOP {len(suggestions)} "
+                        f"OVERSTOCKED ITEMS\n", "warning")
                     for p, sale_price in suggestions:
-                        self._log(f"    {p.name:<20} Qty: {p.quantity:>4}  "
-                                  f"${p.price:.2f} -> ${sale_price:.2f}\n", "warning")
+                        log(f"    {p.name:<20} Qty: {p.quantity:>4}  "
+                            f"${p.price:.2f} -> ${sale_price:.2f}\n", "warning")
 
                     # Ask user via popup on the main thread
                     self._sale_suggestions = suggestions
                     self._sale_approved = None
-                    self.root.after(0, self._show_sale_popup)
-                    # Wait for user response
-                    while self._sale_approved is None:
-                        time.sleep(0.1)
+                    self._sale_event.clear()
+                    flush_log()
+                    after(0, self._show_sale_popup)
+                    # Wait for user response. _on_close sets the event after
+                    # the cancel flag, so a close before clear() is seen here.
+                    if not cancelled():
+                        self._sale_event.wait()
+                    if cancelled():
+                        return
 
                     if self._sale_approved:
                         apply_sales(suggestions)
                         sale_suggestions_applied = suggestions
-                        self._log("  [OK] Sale prices applied!\n", "success")
+                        log("  [OK] Sale prices applied!\n", "success")
                     else:
-                        self._log("  [--] Sales not applied.\n", "dim")
+                        log("  [--] Sales not applied.\n", "dim")
 
             # ── Alcohol price surge (Fri / Sat / Sun) ───────────────
-            alcohol_originals = {}  # product_id -> original_price
+            alcohol_originals = {}  # Product -> original_price
             surge_rate = ALCOHOL_SURGE_RATES.get(day_name)
             if surge_rate:
                 # Build list of alcohol items and their surge prices
-                alcohol_items = []
-                for entry in inventory.all_entries():
-                    p = entry.value
-                    if p.category == "Alcohol":
-                        new_price = round(p.price * (1 + surge_rate), 2)
-                        alcohol_items.append((p, new_price))
+                markup = 1 + surge_rate
+                alcohol_items = [
+                    (p, round(p.price * markup, 2))
+                    for p in get_category_index().get("Alcohol", ())
+                ]
 
                 if alcohol_items:
-                    self._log(f"\n  [ALCOHOL SURGE] Proposing +{int(surge_rate * 100)}% "
-                              f"alcohol markup for {day_name}...\n", "warning")
+                    log(f"\n  [ALCOHOL SURGE] Proposing +{int(surge_rate * 100)}% "
+                        f"alcohol markup for {day_name}...\n", "warning")
                     for p, new_price in alcohol_items:
-                        self._log(f"    {p.name:<24} ${p.price:.2f} -> ${new_price:.2f}\n", "warning")
+                        log(f"    {p.name:<24} ${p.price:.2f} -> ${new_price:.2f}\n", "warning")
 
                     # Ask user via popup on the main thread
                     self._alcohol_surge_items = alcohol_items
                     self._alcohol_surge_rate = surge_rate
                     self._alcohol_surge_day = day_name
                     self._alcohol_surge_approved = None
-                    self.root.after(0, self._show_alcohol_surge_popup)
-                    while self._alcohol_surge_approved is None:
-                        time.sleep(0.1)
+                    self._alcohol_surge_event.clear()
+                    flush_log()
+                    after(0, self._show_alcohol_surge_popup)
+                    if not cancelled():
+                        self._alcohol_surge_event.wait()
+                    if cancelled():
+                        return
 
                     if self._alcohol_surge_approved:
                         for p, new_price in alcohol_items:
-                            alcohol_originals[p.id] = p.price
-                            p.price = new_price
-                        self._log(f"  [OK] {day_name} alcohol surge applied!\n", "success")
+                            alcohol_originals[p] = p.price
+                            set_price(p, new_price)
+                        log(f"  [OK] {day_name} alcohol surge applied!\n", "success")
                     else:
-                        self._log(f"  [--] {day_name} surge declined. Prices unchanged.\n", "dim")
+                        log(f"  [--] {day_name} surge declined. Prices unchanged.\n", "dim")
 
             # ── Time blocks for this day ────────────────────────────
-            high_blocks = HIGH_TRAFFIC_BLOCKS.get(day_name)
-            for block_index, block in enumerate(TIME_BLOCKS):
-                block_label = block["label"]
-                # High-traffic days (Fri/Sat/Sun) use fixed counts
-                if high_blocks:
-                    block_customers = high_blocks[block_index]["customers"]
-                    block_max_cart  = high_blocks[block_index]["max_cart"]
-                else:
-                    block_customers = max(1, int(block["customers"] * traffic))
-                    block_max_cart  = block["max_cart"]
+            for block_index, (block_label, block_customers, block_max_cart) in \
+                    enumerate(DAY_BLOCK_PLANS[day_index]):
                 block_revenue = 0.0
 
-                self._log(f"\n  --- {day_name} | {block_label} "
-                          f"({block_customers} customers) ---\n", "dim")
+                log(f"\n  --- {day_name} | {block_label} "
+                    f"({block_customers} customers) ---\n", "dim")
 
                 # Update playback status + progress
-                progress = day_index * 4 + block_index + 1
-                self.root.after(0, lambda d=day_name, b=block_label:
-                                self.bb_status.config(
-                                    text=f"Day {d} | {b}", fg=ACCENT))
-                self.root.after(0, lambda p=progress:
-                                self.bb_progress.configure(value=p))
+                post_update("progress", day_index * 4 + block_index + 1)
+                post_update("status", (day_status[block_index], ACCENT))
+
+                # Stock changes mutate the shared products in place; the
+                # product set itself is fixed for the whole block
+                products = get_all_products()
 
                 for j in range(1, block_customers + 1):
+                    if cancelled():
+                        return
                     customer_num += 1
                     day_customers += 1
 
-                    profile_name, profile = get_profile_for_time_block(block_index)
+                    profile_name, profile = new_profile(block_index)
                     customer = Customer(profile_name, profile)
-                    products = get_all_products()
 
-                    profile_counts[profile_name] = profile_counts.get(profile_name, 0) + 1
+                    profile_counts[profile_name] += 1
 
                     if not products:
-                        self._log("  [!] No products left in stock!\n", "error")
+                        log("  [!] No products left in stock!\n", "error")
                         break
 
-                    cart = pick_products_by_preference(products, profile, block_max_cart, customer.age)
-
-                    self._log(f"\n  #{customer_num}: ", "customer")
-                    self._log(f"{customer}\n", "info")
+                    cart = pick_cart(products, profile, block_max_cart, customer.age)
 
-                    # Update activity panel with new customer
-                    self.root.after(0, self._update_activity_customer,
-                                   customer, profile_name, customer_num,
-                                   day_name, block_label)
+                    log(f"\n  #{customer_num}: ", "customer")
+                    log(f"{customer}\n", "info")
 
                     customer_total = 0.0
                     customer_items = 0
                     customer_cart_log = []  # (name, qty, price, subtotal, success)
 
                     for product in cart:
-                        qty = random_purchase_amount()
+                        qty = roll_qty()
+                        name, price, stock = product.name, product.price, product.quantity
 
-                        if product.quantity >= qty:
-                            purchase(product.id, qty)
-                            item_cost = product.price * qty
+                        if stock >= qty:
+                            buy(product.id, qty)
+                            item_cost = price * qty
                             week_items_sold += qty
                             day_items_sold += qty
                             week_revenue += item_cost
@@ -1602,64 +2114,56 @@ class MiniMeijerApp:
                             block_revenue += item_cost
                             customer_total += item_cost
                             customer_items += qty
-                            sales_by_product[product.name] = (
-                                sales_by_product.get(product.name, 0) + qty
-                            )
-                            if product.quantity <= 10:
-                                low_stock_hits.add(product.name)
-
-                            self._log(f"    [OK] {qty}x {product.name} "
-                                      f"(${item_cost:.2f})\n", "success")
+                            sales_by_product[name] += qty
+                            if stock - qty <= LOW_STOCK_THRESHOLD:
+                                low_stock_hits.add(name)
+
+                            log(f"    [OK] {qty}x {name} "
+                                f"(${item_cost:.2f})\n", "success")
                             customer_cart_log.append(
-                                (product.name, qty, product.price, item_cost, True))
-                            self.root.after(0, self._update_activity_item,
-                                           product.name, qty, product.price,
-                                           item_cost, True)
-                            self.root.after(0, self._update_activity_totals,
-                                           customer_total, customer_items)
+                                (name, qty, price, item_cost, True))
                         else:
-                            self._log(f"    [X] Wanted {qty}x {product.name} "
-                                      f"but only {product.quantity} left\n", "error")
+                            log(f"    [X] Wanted {qty}x {name} "
+                                f"but only {stock} left\n", "error")
                             customer_cart_log.append(
-                                (product.name, qty, product.price, 0, False))
-                            self.root.after(0, self._update_activity_item,
-                                           product.name, qty, product.price,
-                                           0, False)
+                                (name, qty, price, 0, False))
                             week_failed += 1
                             day_failed += 1
 
-                    self._log(f"  >> {customer.first_name}: "
-                              f"{customer_items} items -- ${customer_total:,.2f}\n", "dim")
-
-                    day_customer_records.append({
-                        "num":         customer_num,
-                        "name":        customer.full_name,
-                        "profession":  customer.profession,
-                        "profile":     profile_name,
-                        "age":         customer.age,
-                        "race":        customer.race,
-                        "total":       customer_total,
-                        "items_count": customer_items,
-                        "cart":        customer_cart_log,
-                    })
+                    # Show the finished customer in the activity panel
+                    post_update("activity", (
+                        customer, profile_name, customer_num, day_name,
+                        block_label, customer_cart_log, customer_total,
+                        customer_items))
+
+                    log(f"  >> {customer.first_name}: "
+                        f"{customer_items} items -- ${customer_total:,.2f}\n", "dim")
+
+                    day_customer_records.append(CustomerRecord(
+                        num=customer_num,
+                        name=customer.full_name,
+                        profession=customer.profession,
+                        profile=profile_name,
+                        age=customer.age,
+                        race=customer.race,
+                        total=customer_total,
+                        items_count=customer_items,
+                        cart=customer_cart_log,
+                    ))
+
+                    flush_log()
 
                     # Live-update blueprint + bottom bar
-                    self.root.after(0, self._refresh_blueprint)
-                    self.root.after(0, self._refresh_bottom_bar)
+                    post_update("stock")
 
-                    time.sleep(0.5 / max(1, self.sim_speed.get()))
+                    pause(0.5 / max(1, self._sim_speed_value))
 
-                sales_by_time_block[block_label] = (
-                    sales_by_time_block.get(block_label, 0) + block_revenue
-                )
+                sales_by_time_block[block_label] += block_revenue
 
             # ── End of day ──────────────────────────────────────────
             # Revert weekend alcohol prices
-            if alcohol_originals:
-                for entry in inventory.all_entries():
-                    p = entry.value
-                    if p.id in alcohol_originals:
-                        p.price = alcohol_originals[p.id]
+            for p, original_price in alcohol_originals.items():
+                set_price(p, original_price)
 
             sales_by_day[day_name] = day_revenue
             customers_by_day[day_name] = day_customers
@@ -1669,25 +2173,28 @@ class MiniMeijerApp:
             day_restocked = 0
             low = get_low_stock()
             if low:
-                self._log(f"\n  [OVERNIGHT RESTOCK] {len(low)} items restocked to {RESTOCK_TARGET}:\n", "warning")
-                for p in low:
-                    restock_amount = RESTOCK_TARGET - p.quantity
-                    if restock_amount > 0:
-                        p.quantity += restock_amount
-                        day_restocked += restock_amount
-                        self._log(f"    [OK] +{restock_amount} {p.name} "
-                                  f"(now {p.quantity})\n", "success")
-
-            self._log(f"\n  -- End of {day_name}: ${day_revenue:,.2f} revenue, "
-                      f"{day_customers} customers --\n", "info")
-
-            # Push this day's customers into the history log
-            records = list(day_customer_records)  # snapshot
-            idx = day_index
-            self.root.after(0, self._add_history_day, day_name, idx, records)
+                log(f"\n  [OVERNIGHT RESTOCK] {len(low)} items restocked to {RESTOCK_TARGET}:\n", "warning")
+                refills = [(p, RESTOCK_TARGET - p.quantity) for p in low
+                           if p.quantity < RESTOCK_TARGET]
+                day_restocked = restock_many(refills)
+                if refills:
+                    log("".join(f"    [OK] +{amount} {p.name} "
+                                f"(now {p.quantity})\n"
+                                for p, amount in refills), "success")
+
+            log(f"\n  -- End of {day_name}: ${day_revenue:,.2f} revenue, "
+                f"{day_customers} customers --\n", "info")
+
+            flush_log()
+
+            # Push this day's customers into the history log. The list is
+            # rebound to a fresh one each day, so it can be handed over as is.
+            after(0, self._add_history_day, day_name, day_index,
+                  day_customer_records)
 
             # Build daily report for warehouse tab
-            low_stock_count = len(get_low_stock())
+            # Counted after the overnight restock, so not len(low) from above
+            low_stock_count = get_low_stock_count()
             daily_reports.append({
                 "day":             day_name,
                 "revenue":         day_revenue,
@@ -1703,9 +2210,10 @@ class MiniMeijerApp:
         # ── Week complete ───────────────────────────────────────────
         value_after = get_total_value()
 
-        self._log("\n" + "=" * 58 + "\n", "header")
-        self._log("  Weekly Simulation Complete!\n", "header")
-        self._log("=" * 58 + "\n", "header")
+        log("\n" + LOG_RULE_EQ, "header")
+        log("  Weekly Simulation Complete!\n", "header")
+        log(LOG_RULE_EQ, "header")
+        flush_log()
 
         self.report_data = {
             "total_revenue":       week_revenue,
@@ -1714,19 +2222,20 @@ class MiniMeijerApp:
             "failed_purchases":    week_failed,
             "value_before":        value_before,
             "value_after":         value_after,
-            "sales_by_product":    sales_by_product,
+            "sales_by_product":    dict(sales_by_product),
             "low_stock_hits":      low_stock_hits,
-            "sales_by_time_block": sales_by_time_block,
+            "sales_by_time_block": dict(sales_by_time_block),
             "sales_by_day":        sales_by_day,
             "customers_by_day":    customers_by_day,
             "deliveries_log":      deliveries_log,
             "daily_reports":       daily_reports,
             "sale_suggestions":    sale_suggestions_applied,
-            "profile_counts":      profile_counts,
+            "profile_counts":      dict(profile_counts),
+            # Chart-ready (label, value) rows, built once per run
+            "time_block_order":    tuple(sales_by_time_block.items()),
+            "profile_order":       tuple(profile_counts.items()),
         }
 
-        self.root.after(0, self._update_after_simulation)
-
     def _show_sale_popup(self):
         """Show a popup asking user to approve Friday sale prices."""
         suggestions = self._sale_suggestions
@@ -1739,6 +2248,7 @@ class MiniMeijerApp:
 
         result = messagebox.askyesno("Friday Sale -- Top 5", msg)
         self._sale_approved = result
+        self._sale_event.set()
 
     def _show_alcohol_surge_popup(self):
         """Show a popup asking user to approve alcohol price surge."""
@@ -1755,6 +2265,7 @@ class MiniMeijerApp:
 
         result = messagebox.askyesno(f"{day} Alcohol Surge", msg)
         self._alcohol_surge_approved = result
+        self._alcohol_surge_event.set()
 
     def _update_after_simulation(self):
         """Update all GUI elements after the simulation completes."""
@@ -1762,11 +2273,14 @@ class MiniMeijerApp:
         if not data:
             return
 
+        # Apply the run's last posted updates now so a pump still pending
+        # can't overwrite the final status below
+        self._ui_pump()
+
         # Refresh tables
         self._refresh_inventory_table()
         self._refresh_low_stock()
-        self._refresh_warehouse()
-        self._refresh_delivery_history()
+        self._refresh_warehouse_tab()
         self._refresh_blueprint()
         self._refresh_bottom_bar()
 
@@ -1777,45 +2291,163 @@ class MiniMeijerApp:
         # Build report
         self._build_report_text(data)
 
-        # Re-enable buttons
+        self._reset_run_controls()
+
+    def _reset_run_controls(self):
+        """Re-enable the run/load buttons once a simulation has finished."""
         self.sim_running = False
         self.run_btn.configure(text="Run Again", bg=GREEN, state=tk.NORMAL)
         self.load_btn.configure(text="Reload Inventory", bg=ACCENT, state=tk.NORMAL)
 
-    def _refresh_inventory_table(self):
-        """Reload the inventory treeview with current data."""
-        self.inv_tree.delete(*self.inv_tree.get_children())
-
-        search = self.search_var.get().lower().strip()
-        products = [e.value for e in inventory.all_entries()]
+    def _get_sorted_inventory(self):
+        """Return products sorted by (category, name) with lowercased search keys.
 
-        # Sort by category then name
-        products.sort(key=lambda p: (p.category, p.name))
+        The sort only depends on product names and categories, which never
+        change after loading, so it is cached until the product set changes.
+        Rows hold the live Product objects, so price and quantity stay current.
+        """
+        if self._inv_cache_dirty or len(self._inv_sorted_cache) != inventory.count:
+            products = sorted(get_all_products(),
+                              key=lambda p: (p.category, p.name))
+            self._inv_sorted_cache = [(p, p.name.lower(), p.category.lower())
+                                      for p in products]
+            self._inv_cache_dirty = False
+        return self._inv_sorted_cache
+
+    def _get_inventory_row_values(self, version):
+        """Return formatted (values, is_low) rows aligned with the sorted cache.
+
+        Formatting prices and building value tuples is the bulk of a table
+        refresh; the results only change with the inventory, so searches
+        reuse them until the inventory version moves on.
+
+        Args:
+            version: The current get_inventory_version() reading.
+        """
+        if version != self._inv_values_version:
+            self._inv_row_values = [
+                ((p.id, p.name, f"${p.price:.2f}", p.quantity, p.category),
+                 p.quantity <= LOW_STOCK_THRESHOLD)
+                for p, _, _ in self._get_sorted_inventory()
+            ]
+            self._inv_values_version = version
+        return self._inv_row_values
 
-        for i, p in enumerate(products):
-            if search and search not in p.name.lower() and search not in p.category.lower():
-                continue
+    def _schedule_inventory_refresh(self):
+        """Debounce search keystrokes into a single inventory table refresh."""
+        if self._search_after_id is not None:
+            self.root.after_cancel(self._search_after_id)
+        self._search_after_id = self.root.after(SEARCH_DEBOUNCE_MS,
+                                                self._refresh_inventory_table)
 
-            tag = "low" if p.quantity <= 10 else ("alt" if i % 2 else "")
-            self.inv_tree.insert("", tk.END, values=(
-                p.id, p.name, f"${p.price:.2f}", p.quantity, p.category
-            ), tags=(tag,))
+    def _refresh_inventory_table(self):
+        """Bring the inventory treeview up to date with the search filter.
+
+        Rows use the product id as their item id and are never rebuilt for
+        a search: rows that stop matching are detached and matching ones
+        re-attached in order. Only rows new to the table are inserted and
+        only rows whose values or tags changed are rewritten. That work is
+        done INV_RENDER_CHUNK rows at a time: the first chunk (the visible
+        rows) right away and the rest on later event-loop turns, so a big
+        table never blocks typing.
+        """
+        # Any refresh (debounced or direct) supersedes a pending search one
+        if self._search_after_id is not None:
+            self.root.after_cancel(self._search_after_id)
+            self._search_after_id = None
 
-        self.inv_tree.tag_configure("low", foreground=RED)
-        self.inv_tree.tag_configure("alt", background=ROW_ALT)
+        search = self.search_var.get().lower().strip()
+        sig = (get_inventory_version(), search)
+        if sig == self._inv_table_sig:
+            return  # Nothing shown in the table has changed
+        self._inv_table_sig = sig
+        cache = self._get_sorted_inventory()
+        row_values = self._get_inventory_row_values(sig[0])
+        if search:
+            matches = [row for (_, name_lc, cat_lc), row in zip(cache, row_values)
+                       if search in name_lc or search in cat_lc]
+        else:
+            matches = row_values
+
+        rows = []
+        for i, (values, is_low) in enumerate(matches):
+            tag = "low" if is_low else ("alt" if i % 2 else "")
+            rows.append((values, ROW_TAGS[tag]))
+
+        # Drop any chunks still pending from an older refresh
+        if self._inv_render_id is not None:
+            self.root.after_cancel(self._inv_render_id)
+            self._inv_render_id = None
+
+        # Delete rows for products that are no longer in the inventory
+        shown = self._inv_rows
+        gone = shown.keys() - {p.id for p, _, _ in cache}
+        if gone:
+            self.inv_tree.delete(*gone)
+            for iid in gone:
+                del shown[iid]
+
+        self._place_inventory_rows(rows, [values[0] for values, _ in rows], 0)
+
+    def _place_inventory_rows(self, rows, iids, start):
+        """Bring one chunk of inventory rows up to date and schedule the next.
+
+        Args:
+            rows:  Full list of (values, tags) rows for the current refresh.
+            iids:  Product ids of those rows, in the same order.
+            start: Index of the first row in this chunk.
+        """
+        self._inv_render_id = None
+        end = start + INV_RENDER_CHUNK
+        shown = self._inv_rows
+
+        with _suspend_redraw(self.inv_tree, self.inv_scrollbar) as tree:
+            for iid, row in zip(iids[start:end], rows[start:end]):
+                old = shown.get(iid)
+                if old is None:
+                    tree.insert("", tk.END, iid=iid, values=row[0], tags=row[1])
+                elif old != row:
+                    tree.item(iid, values=row[0], tags=row[1])
+                shown[iid] = row
+            # One call attaches the rows placed so far, in order, and
+            # detaches every other row (detached rows keep their values)
+            tree.set_children("", *iids[:end])
+
+        if end < len(rows):
+            self._inv_render_id = self.root.after(1, self._place_inventory_rows,
+                                                  rows, iids, end)
 
     def _refresh_low_stock(self):
-        """Reload the low stock treeview."""
-        self.low_tree.delete(*self.low_tree.get_children())
-        low = get_low_stock()
-        for p in low:
-            color_tag = "critical" if p.quantity == 0 else "warn"
-            self.low_tree.insert("", tk.END, values=(
-                p.id, p.name, p.quantity, p.category
-            ), tags=(color_tag,))
+        """Bring the low stock treeview up to date.
 
-        self.low_tree.tag_configure("critical", foreground=RED)
-        self.low_tree.tag_configure("warn", foreground=YELLOW)
+        Rows use the product id as their item id and are diffed against
+        what is on screen: gone products are deleted, new ones inserted at
+        their position, and only rows whose values changed are rewritten.
+        """
+        tree = self.low_tree
+        if tree is None or not self._tab_shown(self._low_tab):
+            return  # Not built yet, or hidden; refreshed when next shown
+        version = get_inventory_version()
+        if version == self._low_stock_sig:
+            return  # Nothing has changed since the last redraw
+        self._low_stock_sig = version
+        low = get_low_stock()
+        shown = self._low_rows
+        rows = {}
+        with _suspend_redraw(tree):
+            # Drop stale rows first so kept rows already sit in list order
+            stale = shown.keys() - {p.id for p in low}
+            if stale:
+                tree.delete(*stale)
+            for index, p in enumerate(low):
+                color_tag = "critical" if p.quantity == 0 else "warn"
+                row = rows[p.id] = ((p.id, p.name, p.quantity, p.category),
+                                    ROW_TAGS[color_tag])
+                if p.id not in shown:
+                    tree.insert("", index, iid=p.id, values=row[0], tags=row[1])
+                elif shown[p.id] != row:
+                    tree.item(p.id, values=row[0], tags=row[1])
+        self._low_rows = rows
 
     def _auto_restock(self):
         """Restock all low items to RESTOCK_TARGET units."""
@@ -1824,29 +2456,105 @@ class MiniMeijerApp:
             messagebox.showinfo("All Good", "No items need restocking.")
             return
 
-        count = 0
-        for p in low:
-            amount = RESTOCK_TARGET - p.quantity
-            if amount > 0:
-                restock(p.id, amount)
-                count += 1
+        refills = [(p, RESTOCK_TARGET - p.quantity) for p in low
+                   if p.quantity < RESTOCK_TARGET]
+        restock_many(refills)
+        count = len(refills)
 
         self._refresh_inventory_table()
         self._refresh_low_stock()
 
         messagebox.showinfo("Restocked", f"Restocked {count} items to {RESTOCK_TARGET} units each.")
 
+    def _post_update(self, key, value=True):
+        """Record a pending UI update to be applied by _ui_pump (thread-safe).
+
+        Repeated posts of the same key before the next pump overwrite each
+        other, so the widgets behind it redraw at most once per UI_PUMP_MS.
+
+        Args:
+            key:   Which part of the UI is stale: "stock", "status" (a
+                   (text, color) pair), "progress" (a block count) or
+                   "activity" (_show_customer_activity arguments).
+            value: Latest value for that part; True for plain dirty flags.
+        """
+        with self._update_lock:
+            self._pending_updates[key] = value
+            if self._update_pump_pending:
+                return
+            self._update_pump_pending = True
+        self.root.after(UI_PUMP_MS, self._ui_pump)
+
+    def _ui_pump(self):
+        """Apply every UI update posted since the last pump in one pass."""
+        with self._update_lock:
+            updates = self._pending_updates
+            self._pending_updates = {}
+            self._update_pump_pending = False
+
+        if "stock" in updates:
+            self._schedule_blueprint_refresh()
+            self._refresh_bottom_bar()
+
+        status = updates.get("status")
+        if status is not None:
+            text, fg = status
+            self.bb_status.config(text=text, fg=fg)
+        progress = updates.get("progress")
+        if progress is not None:
+            self.bb_progress.configure(value=progress)
+        activity = updates.get("activity")
+        if activity is not None:
+            self._show_customer_activity(*activity)
+
     def _log(self, text, tag=None):
-        """Append text to the simulation log (thread-safe)."""
-        def _append():
-            self.sim_text.configure(state=tk.NORMAL)
-            if tag:
-                self.sim_text.insert(tk.END, text, tag)
-            else:
-                self.sim_text.insert(tk.END, text)
-            self.sim_text.see(tk.END)
-            self.sim_text.configure(state=tk.DISABLED)
-        self.root.after(0, _append)
+        """Append text to the simulation log (thread-safe).
+
+        Writes are queued and applied by _flush_log at most once every
+        LOG_FLUSH_MS, so a burst of log lines costs a single widget update.
+        """
+        self._log_many(((text, tag),))
+
+    def _log_many(self, entries):
+        """Queue several (text, tag) log writes under one lock acquisition."""
+        if not entries:
+            return
+        with self._log_lock:
+            self._log_queue.extend(entries)
+            if self._log_flush_pending:
+                return
+            self._log_flush_pending = True
+        self.root.after(LOG_FLUSH_MS, self._flush_log)
+
+    def _flush_log(self):
+        """Write queued log text to the log widget in one insert.
+
+        At most LOG_FLUSH_MAX entries are written per call; if more are
+        waiting, another flush is scheduled so a large backlog is spread
+        over several event-loop turns instead of freezing the window.
+        """
+        queue = self._log_queue
+        with self._log_lock:
+            take = min(len(queue), LOG_FLUSH_MAX)
+            entries = [queue.popleft() for _ in range(take)]
+            self._log_flush_pending = bool(queue)
+        if self._log_flush_pending:
+            self.root.after(LOG_FLUSH_MS, self._flush_log)
+        if not entries:
+            return
+
+        text = self.sim_text
+        text.configure(state=tk.NORMAL)
+        text.insert(tk.END, *_merge_tag_runs(entries))
+
+        # Keep at most LOG_MAX_LINES lines so the widget stays light. Trim
+        # LOG_TRIM_LINES below the cap so it isn't re-trimmed every flush.
+        lines = int(text.index("end-1c").split(".")[0])
+        if lines > LOG_MAX_LINES:
+            text.delete("1.0", f"{lines - LOG_MAX_LINES + LOG_TRIM_LINES + 1}.0")
+
+        text.see(tk.END)
+        text.configure(state=tk.DISABLED)
 
     # ─── Chart Helpers ──────────────────────────────────────────────
 
@@ -1871,6 +2579,7 @@ class MiniMeijerApp:
 
     def _embed_chart(self, parent, fig, height=320):
         """Embed a matplotlib figure into a tkinter parent frame."""
+        _, _, FigureCanvasTkAgg = _load_matplotlib()
         canvas = FigureCanvasTkAgg(fig, master=parent)
         widget = canvas.get_tk_widget()
         widget.configure(height=height, bg=BG)
@@ -1898,18 +2607,29 @@ class MiniMeijerApp:
                      bg=BG_CARD, fg=FG_DIM).pack()
 
     def _add_text_card(self, parent, title, lines, title_color=PURPLE):
-        """Add a card with a title and list of text lines."""
+        """Add a card with a title and list of text lines.
+
+        The lines share a single multi-line Label rather than one widget
+        per line, which keeps large cards cheap to build and lay out.
+        """
         card = tk.Frame(parent, bg=BG_CARD, padx=15, pady=12)
         card.pack(fill=tk.X, padx=15, pady=(0, 10))
         tk.Label(card, text=title, font=FONT_BOLD,
                  bg=BG_CARD, fg=title_color).pack(anchor=tk.W)
-        for line in lines:
-            tk.Label(card, text=line, font=FONT_MONO,
+        if lines:
+            tk.Label(card, text="\n".join(lines), font=FONT_MONO,
                      bg=BG_CARD, fg=FG, anchor=tk.W,
                      justify=tk.LEFT).pack(anchor=tk.W, pady=1)
 
     def _build_report_text(self, data):
         """Build the full report tab with matplotlib charts and stat cards."""
+        if self.report_inner is None or not self._tab_shown(self._report_tab):
+            return  # Not built yet, or hidden; rendered when next shown
+        if data is self._rendered_report:
+            return  # Already showing this run's report
+        self._rendered_report = data
+        plt, _, _ = _load_matplotlib()
+
         # Clear previous content
         for widget in self.report_inner.winfo_children():
             widget.destroy()
@@ -1982,13 +2702,12 @@ class MiniMeijerApp:
         # ══════════════════════════════════════════════════════════
         # 3. REVENUE BY TIME BLOCK  (horizontal bar chart)
         # ══════════════════════════════════════════════════════════
-        time_sales = data.get("sales_by_time_block", {})
+        time_sales = data.get("time_block_order", ())
         if time_sales:
             self._add_section_label(self.report_inner, "Revenue by Time Block")
 
             fig, ax = plt.subplots(figsize=(8, 2.4))
-            labels = list(time_sales.keys())
-            values = list(time_sales.values())
+            labels, values = zip(*time_sales)
             bar_colors = [ACCENT, PURPLE, GREEN, YELLOW]
 
             bars = ax.barh(labels[::-1], values[::-1],
@@ -2010,13 +2729,12 @@ class MiniMeijerApp:
         # ══════════════════════════════════════════════════════════
         # 4. SHOPPER PROFILE DISTRIBUTION  (pie chart)
         # ══════════════════════════════════════════════════════════
-        profile_counts = data.get("profile_counts", {})
-        if profile_counts:
+        profile_rows = data.get("profile_order", ())
+        if profile_rows:
             self._add_section_label(self.report_inner, "Shopper Profile Distribution")
 
             fig, ax = plt.subplots(figsize=(6, 3.5))
-            names = list(profile_counts.keys())
-            counts = list(profile_counts.values())
+            names, counts = zip(*profile_rows)
             pie_colors = colors[:len(names)]
 
             wedges, texts, autotexts = ax.pie(
@@ -2043,8 +2761,7 @@ class MiniMeijerApp:
         if sales:
             self._add_section_label(self.report_inner, "Top 10 Most Purchased Items")
 
-            sorted_sales = sorted(sales.items(), key=lambda x: -x[1])
-            top = sorted_sales[:10]
+            top = heapq.nlargest(10, sales.items(), key=lambda x: x[1])
             top_names = [s[0] for s in top][::-1]
             top_qtys  = [s[1] for s in top][::-1]
 
@@ -2066,8 +2783,10 @@ class MiniMeijerApp:
             fig.tight_layout()
             self._embed_chart(self.report_inner, fig, height=300)
 
-            # Bottom 3 as text card
-            bottom = sorted_sales[-3:]
+            # Bottom 3 as text card (scanning newest-first and reversing keeps
+            # the same picks and order as the tail of a full descending sort)
+            bottom = heapq.nsmallest(3, reversed(sales.items()),
+                                     key=lambda x: x[1])[::-1]
             bottom_lines = [f"{name:<22} {qty} sold" for name, qty in bottom]
             self._add_text_card(self.report_inner, "Bottom 3 Least Purchased",
                                 bottom_lines, title_color=YELLOW)
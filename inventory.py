@@ -1,5 +1,6 @@
 import random
 import string
+import sys
 from config import CONFIG
 
 
@@ -172,6 +173,11 @@ class HashMap:
                 return True
         return False
 
+    def clear(self):
+        """Remove every entry in one pass, keeping the current bucket count."""
+        self.buckets = [[] for _ in range(self.size)]
+        self.count = 0
+
     def all_entries(self):
         """Yield every Entry in the map by walking all buckets.
 
@@ -225,6 +231,22 @@ LOW_STOCK_THRESHOLD = CONFIG["low_stock_threshold"]
 inventory = HashMap(CONFIG["inventory_map_size"])
 categories = HashMap(CONFIG["categories_map_size"])
 
+# Running inventory totals, kept in step with every stock and price change
+# so get_total_value() / get_total_quantity() / get_low_stock_count() never
+# rescan the inventory. "low" counts products at or below LOW_STOCK_THRESHOLD.
+# "version" is bumped on every change so views can skip no-op refreshes.
+_totals = {"value": 0.0, "quantity": 0, "low": 0, "version": 0}
+
+# Units in stock per category, kept in step the same way as _totals so
+# per-category views never have to sum over products.
+_category_qty = {}
+
+# Snapshots derived from the product set ("products", "name_index",
+# "by_category"), dropped
+# only when products are added or removed. Stock and price changes mutate
+# the Product objects, so the snapshots stay current.
+_snapshot = {}
+
 
 # ─── Helper Functions ───────────────────────────────────────────────
 
@@ -260,8 +282,40 @@ def _validate_positive(value, label="Amount"):
 
 
 def get_all_products():
-    """Return a list of every Product currently in the inventory."""
-    return [e.value for e in inventory.all_entries()]
+    """Return every Product currently in the inventory.
+
+    The tuple is cached and shared between callers until a product is
+    added or removed, so repeated calls don't re-walk the hash map.
+    """
+    products = _snapshot.get("products")
+    if products is None:
+        products = _snapshot["products"] = tuple(e.value for e in inventory.all_entries())
+    return products
+
+
+def _name_index():
+    """Return cached (lowercased name, Product) pairs for name searches."""
+    index = _snapshot.get("name_index")
+    if index is None:
+        index = _snapshot["name_index"] = tuple(
+            (p.name.lower(), p) for p in get_all_products())
+    return index
+
+
+def get_category_index():
+    """Return a cached {category: tuple of Products} mapping.
+
+    Products keep the order get_all_products() returns them in, so code
+    that used to filter the full inventory by category sees the same
+    sequence. Shared between callers until a product is added or removed.
+    """
+    index = _snapshot.get("by_category")
+    if index is None:
+        index = {}
+        for p in get_all_products():
+            index.setdefault(p.category, []).append(p)
+        index = _snapshot["by_category"] = {c: tuple(ps) for c, ps in index.items()}
+    return index
 
 
 def _print_product_list(products, empty_msg="  No products found."):
@@ -299,11 +353,18 @@ def add_product(name, price, quantity, category):
     if price < 0 or quantity < 0:
         print("  [X] Price and quantity must be non-negative.")
         return None
+    category = sys.intern(category)  # Shares identity with CONFIG keys
     product = Product(product_id, name, price, quantity, category)
     inventory.set(product_id, product)
     if categories.get(category) is None:
         categories.set(category, [])
     categories.get(category).append(product_id)
+    _snapshot.clear()
+    _totals["value"] += price * quantity
+    _totals["quantity"] += quantity
+    _totals["low"] += quantity <= LOW_STOCK_THRESHOLD
+    _totals["version"] += 1
+    _category_qty[category] = _category_qty.get(category, 0) + quantity
     print(f"  [OK] Added '{name}' with ID: {product_id}")
     return product_id
 
@@ -323,7 +384,7 @@ def purchase(product_id, amount):
     if product.quantity < amount:
         print(f"  [X] Insufficient stock. Available: {product.quantity}")
         return
-    product.quantity -= amount
+    adjust_stock(product, -amount)
     print(f"  [OK] Purchased {amount}x {product.name}. Remaining: {product.quantity}")
     if product.quantity <= LOW_STOCK_THRESHOLD:
         print(f"  [!] Low stock alert: {product.name} ({product.quantity} left)")
@@ -339,7 +400,7 @@ def restock(product_id, amount):
     product = _find_product(product_id)
     if product is None or not _validate_positive(amount):
         return
-    product.quantity += amount
+    adjust_stock(product, amount)
     print(f"  [OK] Restocked {product.name}. New quantity: {product.quantity}")
 
 
@@ -356,9 +417,87 @@ def remove_product(product_id):
     if cat_list and product_id in cat_list:
         cat_list.remove(product_id)
     inventory.delete(product_id)
+    _snapshot.clear()
+    _totals["value"] -= product.price * product.quantity
+    _totals["quantity"] -= product.quantity
+    _totals["low"] -= product.quantity <= LOW_STOCK_THRESHOLD
+    _totals["version"] += 1
+    _category_qty[product.category] -= product.quantity
     print(f"  [OK] Removed '{product.name}'")
 
 
+def clear_inventory():
+    """Remove every product and category listing from the inventory."""
+    inventory.clear()
+    categories.clear()
+    _snapshot.clear()
+    _totals["value"] = 0.0
+    _totals["quantity"] = 0
+    _totals["low"] = 0
+    _totals["version"] += 1
+    _category_qty.clear()
+
+
+def adjust_stock(product, amount):
+    """Change a product's quantity without printing, keeping totals in step.
+
+    Bulk callers (deliveries, overnight restocks, the simulators) use this
+    instead of assigning product.quantity directly.
+
+    Args:
+        product: The Product to adjust.
+        amount:  Units to add (negative to remove).
+    """
+    was_low = product.quantity <= LOW_STOCK_THRESHOLD
+    product.quantity += amount
+    _totals["quantity"] += amount
+    _totals["low"] += (product.quantity <= LOW_STOCK_THRESHOLD) - was_low
+    _totals["value"] += product.price * amount
+    _totals["version"] += 1
+    _category_qty[product.category] += amount
+
+
+def restock_many(pairs):
+    """Add stock to several products at once without printing.
+
+    Works like adjust_stock() per product, but the running totals are
+    updated once for the whole batch instead of once per product.
+
+    Args:
+        pairs: Iterable of (Product, units to add) pairs.
+
+    Returns:
+        The total number of units added.
+    """
+    units = low = 0
+    value = 0.0
+    for product, amount in pairs:
+        was_low = product.quantity <= LOW_STOCK_THRESHOLD
+        product.quantity += amount
+        units += amount
+        low += (product.quantity <= LOW_STOCK_THRESHOLD) - was_low
+        value += product.price * amount
+        _category_qty[product.category] += amount
+    if units:
+        _totals["quantity"] += units
+        _totals["low"] += low
+        _totals["value"] += value
+        _totals["version"] += 1
+    return units
+
+
+def set_price(product, new_price):
+    """Change a product's unit price without printing, keeping totals in step.
+
+    Args:
+        product:   The Product to reprice.
+        new_price: The new unit price.
+    """
+    _totals["value"] += (new_price - product.price) * product.quantity
+    _totals["version"] += 1
+    product.price = new_price
+
+
 def update_price(product_id, new_price):
     """Change the unit price of a product.
 
@@ -373,7 +512,7 @@ def update_price(product_id, new_price):
         print("  [X] Price must be non-negative.")
         return
     old_price = product.price
-    product.price = new_price
+    set_price(product, new_price)
     print(f"  [OK] Updated {product.name}: ${old_price:.2f} -> ${new_price:.2f}")
 
 
@@ -402,23 +541,52 @@ def search_by_name(name):
         A list of matching Product objects.
     """
     term = name.lower()
-    return [e.value for e in inventory.all_entries() if term in e.value.name.lower()]
+    return [p for name_lc, p in _name_index() if term in name_lc]
 
 
 def get_low_stock():
     """Return all products whose quantity is at or below LOW_STOCK_THRESHOLD."""
-    return [e.value for e in inventory.all_entries()
-            if e.value.quantity <= LOW_STOCK_THRESHOLD]
+    return [p for p in get_all_products() if p.quantity <= LOW_STOCK_THRESHOLD]
 
 
 def get_total_value():
-    """Calculate the total dollar value of all products in the inventory."""
-    return sum(e.value.price * e.value.quantity for e in inventory.all_entries())
+    """Return the total dollar value of all products in the inventory.
+
+    Read from the running total, rounded to cents so float drift from
+    incremental updates never shows up.
+    """
+    return round(_totals["value"], 2)
 
 
 def get_total_quantity():
     """Return the total number of units across all products in the inventory."""
-    return sum(e.value.quantity for e in inventory.all_entries())
+    return _totals["quantity"]
+
+
+def get_low_stock_count():
+    """Return how many products are at or below LOW_STOCK_THRESHOLD."""
+    return _totals["low"]
+
+
+def get_category_stock(category):
+    """Return (units in stock, number of products) for a category.
+
+    Both come from running counts, so no products are visited.
+
+    Args:
+        category: The category label.
+    """
+    product_ids = categories.get(category)
+    return _category_qty.get(category, 0), len(product_ids) if product_ids else 0
+
+
+def get_inventory_version():
+    """Return a counter that changes whenever any product, price or stock does.
+
+    Comparing two readings is a cheap way to tell whether the inventory
+    has changed since a view was last drawn.
+    """
+    return _totals["version"]
 
 
 def print_inventory():
@@ -428,8 +596,8 @@ def print_inventory():
         return
     print(f"  {'ID':<10} | {'Name':<20} | {'Price':<9} | {'Qty':<9} | Category")
     print("  " + "-" * 70)
-    for entry in inventory.all_entries():
-        print(f"  {entry.value}")
+    for product in get_all_products():
+        print(f"  {product}")
     print("  " + "-" * 70)
     print(f"  Total Products: {inventory.count}")
     print(f"  Total Units:    {get_total_quantity()}")
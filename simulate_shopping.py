@@ -10,13 +10,20 @@ with demographic profiles that drive shopping time and category
 preferences.
 """
 
+import heapq
 import random
+import sys
 import time
+from bisect import bisect_right
+from collections import defaultdict
+from functools import lru_cache
+from itertools import accumulate
 from config import CONFIG
 from inventory import (
-    seed_inventory, inventory, purchase, restock,
+    seed_inventory, purchase, restock,
     print_inventory, get_low_stock, get_total_value, update_price,
-    get_all_products
+    get_all_products, get_category_index, adjust_stock, restock_many,
+    set_price, LOW_STOCK_THRESHOLD
 )
 
 # ─── Configuration (pulled from central config.py) ─────────────────
@@ -42,6 +49,63 @@ ALCOHOL_AGE_RULES    = CONFIG["alcohol_age_rules"]
 STEAK_WINE_CHANCE    = CONFIG["steak_wine_chance"]
 ALCOHOL_SURGE_RATES  = CONFIG["alcohol_surge_rates"]
 HIGH_TRAFFIC_BLOCKS  = CONFIG["high_traffic_blocks"]
+PURCHASE_TIERS       = CONFIG["purchase_tiers"]
+
+
+# ─── Derived Lookup Tables (built once at import) ──────────────────
+
+def _build_profile_professions():
+    """Invert PROFESSION_TO_PROFILE into profile name -> tuple of professions."""
+    table = {}
+    for profession, profile_name in PROFESSION_TO_PROFILE.items():
+        table.setdefault(profile_name, []).append(profession)
+    return {name: tuple(professions) for name, professions in table.items()}
+
+
+PROFILE_PROFESSIONS  = _build_profile_professions()
+PROFILE_NAMES        = tuple(SHOPPER_PROFILES)
+
+# Cumulative time_weights per time block, ready for random.choices(cum_weights=...)
+PROFILE_CUM_WEIGHTS  = tuple(
+    tuple(accumulate(SHOPPER_PROFILES[name]["time_weights"][i] for name in PROFILE_NAMES))
+    for i in range(len(TIME_BLOCKS))
+)
+
+# Purchase tiers split into cumulative chances + (min, max) ranges for bisect
+PURCHASE_TIER_CUM    = tuple(accumulate(tier["chance"] for tier in PURCHASE_TIERS))
+PURCHASE_TIER_RANGES = tuple((tier["min"], tier["max"]) for tier in PURCHASE_TIERS)
+
+# Day-indexed views of the weekly schedule, aligned with DAY_NAMES
+DAY_TRAFFIC_BY_INDEX = tuple(DAY_TRAFFIC[day_name] for day_name in DAY_NAMES)
+IS_DELIVERY_DAY      = tuple(day_name in DELIVERY_DAYS for day_name in DAY_NAMES)
+
+
+def _build_day_block_plans():
+    """Resolve each day's time blocks into (label, customers, max_cart) rows.
+
+    High-traffic days (Fri/Sat/Sun) use their fixed per-block counts;
+    every other day scales the base block counts by its traffic multiplier.
+
+    Returns:
+        Tuple aligned with DAY_NAMES, each entry a tuple of per-block rows.
+    """
+    plans = []
+    for day_name, traffic in zip(DAY_NAMES, DAY_TRAFFIC_BY_INDEX):
+        high_blocks = HIGH_TRAFFIC_BLOCKS.get(day_name)
+        rows = []
+        for block_index, block in enumerate(TIME_BLOCKS):
+            if high_blocks:
+                override = high_blocks[block_index]
+                rows.append((block["label"], override["customers"], override["max_cart"]))
+            else:
+                rows.append((block["label"],
+                             max(1, int(block["customers"] * traffic)),
+                             block["max_cart"]))
+        plans.append(tuple(rows))
+    return tuple(plans)
+
+
+DAY_BLOCK_PLANS      = _build_day_block_plans()
 
 
 def process_delivery(day_name):
@@ -60,12 +124,13 @@ def process_delivery(day_name):
     print(f"  (Only restocking items with {DELIVERY_RESTOCK_MAX} or fewer units)")
 
     total_units = 0
+    by_category = get_category_index()
 
     for category, units in WAREHOUSE_STOCK.items():
         # Find products in this category that need restocking
         products_in_cat = [
-            e.value for e in inventory.all_entries()
-            if e.value.category == category and e.value.quantity <= DELIVERY_RESTOCK_MAX
+            p for p in by_category.get(category, ())
+            if p.quantity <= DELIVERY_RESTOCK_MAX
         ]
         if not products_in_cat:
             continue
@@ -77,7 +142,7 @@ def process_delivery(day_name):
         for i, p in enumerate(products_in_cat):
             amount = per_product + (1 if i < remainder else 0)
             if amount > 0:
-                p.quantity += amount
+                adjust_stock(p, amount)
                 total_units += amount
                 print(f"    [OK] +{amount} {p.name} (now {p.quantity})")
 
@@ -93,7 +158,7 @@ def friday_sale_suggestions():
     is higher).  From all qualifying products, 5 are chosen at random
     so the sale list varies every week.
     """
-    all_products = [e.value for e in inventory.all_entries()]
+    all_products = get_all_products()
     if not all_products:
         return []
 
@@ -131,7 +196,7 @@ def apply_sales(suggestions):
     """Apply the suggested sale prices to products."""
     for p, sale_price in suggestions:
         old = p.price
-        p.price = sale_price
+        set_price(p, sale_price)
         print(f"  [OK] {p.name}: ${old:.2f} -> ${sale_price:.2f}")
     print(f"  [OK] {len(suggestions)} items now on sale!")
 
@@ -147,9 +212,8 @@ def get_profile_for_time_block(block_index):
     Returns:
         (profile_name, profile_dict) tuple.
     """
-    profile_names = list(SHOPPER_PROFILES.keys())
-    weights = [SHOPPER_PROFILES[name]["time_weights"][block_index] for name in profile_names]
-    chosen = random.choices(profile_names, weights=weights, k=1)[0]
+    chosen = random.choices(PROFILE_NAMES,
+                            cum_weights=PROFILE_CUM_WEIGHTS[block_index], k=1)[0]
     return chosen, SHOPPER_PROFILES[chosen]
 
 
@@ -246,17 +310,14 @@ def pick_products_by_preference(products, profile, max_items, customer_age=None)
 def random_purchase_amount():
     """Return a weighted random quantity to simulate real buying patterns.
 
-    Uses purchase_tiers from CONFIG to determine ranges and chances.
+    Uses the precomputed PURCHASE_TIER_CUM table to pick a tier with a
+    single bisect instead of re-summing the tier chances on every call.
     """
     roll = random.randint(0, 99)
-    cumulative = 0
-    for tier in CONFIG["purchase_tiers"]:
-        cumulative += tier["chance"]
-        if roll < cumulative:
-            return random.randint(tier["min"], tier["max"])
-    # Fallback to last tier
-    last = CONFIG["purchase_tiers"][-1]
-    return random.randint(last["min"], last["max"])
+    # Rolls past the last cumulative chance fall back to the last tier
+    tier_index = min(bisect_right(PURCHASE_TIER_CUM, roll), len(PURCHASE_TIER_RANGES) - 1)
+    lo, hi = PURCHASE_TIER_RANGES[tier_index]
+    return random.randint(lo, hi)
 
 # ─── Customer Demographics ──────────────────────────────────────────
 
@@ -267,6 +328,10 @@ class Customer:
     the profile's age range, and their shopper_type is set accordingly.
     """
 
+    # One is created per simulated shopper, so skip the per-instance dict
+    __slots__ = ("first_name", "last_name", "race", "shopper_type",
+                 "age", "profession")
+
     def __init__(self, profile_name=None, profile=None):
         self.first_name = random.choice(FIRST_NAMES)
         self.last_name = random.choice(LAST_NAMES)
@@ -277,7 +342,7 @@ class Customer:
             age_lo, age_hi = profile["age_range"]
             self.age = random.randint(age_lo, age_hi)
             # Pick a profession that maps to this profile
-            matching = [p for p, t in PROFESSION_TO_PROFILE.items() if t == profile_name]
+            matching = PROFILE_PROFESSIONS.get(profile_name)
             self.profession = random.choice(matching) if matching else profile_name
         else:
             self.age = random.randint(18, 80)
@@ -318,18 +383,27 @@ def simulate():
     week_revenue = 0.0
     week_failed = 0
     week_customers = 0
-    sales_by_product = {}         # product name -> units sold (all week)
+    sales_by_product = defaultdict(int)       # product name -> units sold (all week)
     low_stock_hits = set()        # products that hit low stock at any point
-    sales_by_time_block = {}      # time label -> total revenue across all days
+    sales_by_time_block = defaultdict(float)  # time label -> revenue across all days
     sales_by_day = {}             # day name -> revenue
     customers_by_day = {}         # day name -> customer count
     deliveries_log = []           # list of (day, total_units) tuples
     sale_suggestions_applied = [] # products put on sale Friday
     customer_num = 0
 
+    # Pacing only helps someone watching a terminal; redirected output runs flat out
+    customer_delay = DELAY_BETWEEN if sys.stdout.isatty() else 0
+
+    # Bind hot-loop callables to locals once
+    buy = purchase
+    roll_qty = random_purchase_amount
+    new_profile = get_profile_for_time_block
+    pick_cart = pick_products_by_preference
+
     # ── Step 2: Loop through 7 days ─────────────────────────────────
     for day_index, day_name in enumerate(DAY_NAMES):
-        traffic = DAY_TRAFFIC[day_name]
+        traffic = DAY_TRAFFIC_BY_INDEX[day_index]
         day_revenue = 0.0
         day_customers = 0
 
@@ -339,7 +413,7 @@ def simulate():
         print("#" * 60)
 
         # ── Delivery truck (Tuesday, before store opens) ──
-        if day_name in DELIVERY_DAYS:
+        if IS_DELIVERY_DAY[day_index]:
             process_delivery(day_name)
             delivered = sum(WAREHOUSE_STOCK.values())
             deliveries_log.append((day_name, delivered))
@@ -357,45 +431,39 @@ def simulate():
                     print("  [--] Sales not applied. Prices unchanged.")
 
         # ── Alcohol price surge (Fri / Sat / Sun) ──────────────────
-        alcohol_originals = {}  # product_id -> original_price
+        alcohol_originals = {}  # Product -> original_price
         surge_rate = ALCOHOL_SURGE_RATES.get(day_name)
         if surge_rate:
-            for entry in inventory.all_entries():
-                p = entry.value
-                if p.category == "Alcohol":
-                    alcohol_originals[p.id] = p.price
-                    p.price = round(p.price * (1 + surge_rate), 2)
+            markup = 1 + surge_rate
+            for p in get_category_index().get("Alcohol", ()):
+                alcohol_originals[p] = p.price
+                set_price(p, round(p.price * markup, 2))
             print(f"\n  [ALCOHOL SURGE] Alcohol prices +{int(surge_rate * 100)}% today ({day_name})")
 
         # ── Run each time block for this day ───────────────────────
-        high_blocks = HIGH_TRAFFIC_BLOCKS.get(day_name)
-        for block_index, block in enumerate(TIME_BLOCKS):
-            block_label = block["label"]
-            # High-traffic days (Fri/Sat/Sun) use fixed counts
-            if high_blocks:
-                block_customers = high_blocks[block_index]["customers"]
-                block_max_cart  = high_blocks[block_index]["max_cart"]
-            else:
-                block_customers = max(1, int(block["customers"] * traffic))
-                block_max_cart  = block["max_cart"]
+        for block_index, (block_label, block_customers, block_max_cart) in \
+                enumerate(DAY_BLOCK_PLANS[day_index]):
             block_revenue = 0.0
 
             print(f"\n  --- {day_name} | {block_label} "
                   f"({block_customers} customers) ---")
 
+            # Stock changes mutate the shared products in place; the
+            # product set itself is fixed for the whole block
+            products = get_all_products()
+
             for j in range(1, block_customers + 1):
                 customer_num += 1
                 day_customers += 1
 
-                profile_name, profile = get_profile_for_time_block(block_index)
+                profile_name, profile = new_profile(block_index)
                 customer = Customer(profile_name, profile)
-                products = get_all_products()
 
                 if not products:
                     print("  [!] No products left in stock!")
                     break
 
-                cart = pick_products_by_preference(products, profile, block_max_cart, customer.age)
+                cart = pick_cart(products, profile, block_max_cart, customer.age)
 
                 print(f"\n  Customer #{customer_num}: {customer}")
 
@@ -403,44 +471,39 @@ def simulate():
                 customer_items = 0
 
                 for product in cart:
-                    qty = random_purchase_amount()
+                    qty = roll_qty()
+                    name, price, stock = product.name, product.price, product.quantity
 
-                    if product.quantity >= qty:
-                        purchase(product.id, qty)
-                        item_cost = product.price * qty
+                    if stock >= qty:
+                        buy(product.id, qty)
+                        item_cost = price * qty
                         week_items_sold += qty
                         week_revenue += item_cost
                         day_revenue += item_cost
                         block_revenue += item_cost
                         customer_total += item_cost
                         customer_items += qty
-                        sales_by_product[product.name] = (
-                            sales_by_product.get(product.name, 0) + qty
-                        )
-                        if product.quantity <= 10:
-                            low_stock_hits.add(product.name)
+                        sales_by_product[name] += qty
+                        if stock - qty <= LOW_STOCK_THRESHOLD:
+                            low_stock_hits.add(name)
                     else:
                         print(f"    [X] {customer.full_name} wanted {qty}x "
-                              f"{product.name} but only {product.quantity} left")
+                              f"{name} but only {stock} left")
                         week_failed += 1
 
                 print(f"  >> {customer.first_name}'s total: "
                       f"{customer_items} items -- ${customer_total:,.2f}")
 
-                time.sleep(DELAY_BETWEEN)
+                if customer_delay:
+                    time.sleep(customer_delay)
 
             # Accumulate time block revenue across the week
-            sales_by_time_block[block_label] = (
-                sales_by_time_block.get(block_label, 0) + block_revenue
-            )
+            sales_by_time_block[block_label] += block_revenue
 
         # ── End of day summary ──────────────────────────────────────
         # Revert weekend alcohol prices
-        if alcohol_originals:
-            for entry in inventory.all_entries():
-                p = entry.value
-                if p.id in alcohol_originals:
-                    p.price = alcohol_originals[p.id]
+        for p, original_price in alcohol_originals.items():
+            set_price(p, original_price)
 
         sales_by_day[day_name] = day_revenue
         customers_by_day[day_name] = day_customers
@@ -455,11 +518,11 @@ def simulate():
         # ── End-of-day restock: replenish low items overnight ───────
         if low:
             print(f"\n  [OVERNIGHT RESTOCK] {len(low)} low-stock items restocked to {RESTOCK_TARGET}:")
-            for p in low:
-                restock_amount = RESTOCK_TARGET - p.quantity
-                if restock_amount > 0:
-                    p.quantity += restock_amount
-                    print(f"    [OK] +{restock_amount} {p.name} (now {p.quantity})")
+            refills = [(p, RESTOCK_TARGET - p.quantity) for p in low
+                       if p.quantity < RESTOCK_TARGET]
+            restock_many(refills)
+            for p, amount in refills:
+                print(f"    [OK] +{amount} {p.name} (now {p.quantity})")
         else:
             print("  [OK] All shelves stocked -- no overnight restock needed.")
 
@@ -477,11 +540,14 @@ def simulate():
     print(f"  Inventory value end:     ${value_after:,.2f}")
     print(f"  Deliveries received:     {len(deliveries_log)}")
 
+    # Percent of the week's revenue: one multiply per row instead of a divide
+    pct_scale = 100 / week_revenue if week_revenue else 0
+
     # Revenue by day
     print(f"\n  [REVENUE BY DAY]")
     for day, rev in sales_by_day.items():
-        pct = (rev / week_revenue * 100) if week_revenue else 0
-        bar = "#" * int(pct / 2)
+        pct = rev * pct_scale
+        bar = _bar(int(pct / 2))
         custs = customers_by_day[day]
         print(f"     {day:<12} ${rev:>8,.2f}  ({pct:4.1f}%)  "
               f"{custs:>3} customers  {bar}")
@@ -489,8 +555,8 @@ def simulate():
     # Revenue by time block (aggregated across all 7 days)
     print(f"\n  [REVENUE BY TIME BLOCK (weekly total)]")
     for label, rev in sales_by_time_block.items():
-        pct = (rev / week_revenue * 100) if week_revenue else 0
-        bar = "#" * int(pct / 2)
+        pct = rev * pct_scale
+        bar = _bar(int(pct / 2))
         print(f"     {label:<25} ${rev:>8,.2f}  ({pct:4.1f}%)  {bar}")
 
     # Delivery log
@@ -514,9 +580,9 @@ def simulate():
         "failed_purchases": week_failed,
         "value_before": value_before,
         "value_after": value_after,
-        "sales_by_product": sales_by_product,
+        "sales_by_product": dict(sales_by_product),
         "low_stock_hits": low_stock_hits,
-        "sales_by_time_block": sales_by_time_block,
+        "sales_by_time_block": dict(sales_by_time_block),
         "sales_by_day": sales_by_day,
         "customers_by_day": customers_by_day,
         "deliveries_log": deliveries_log,
@@ -525,6 +591,15 @@ def simulate():
     post_simulation_menu(report_data)
 
 
+REPORT_BAR_WIDTH = 40   # Longest quantity bar drawn in the weekly report
+
+
+@lru_cache(maxsize=None)
+def _bar(length, char="#"):
+    """Return a report bar of the given length; bar lengths repeat, so cache them."""
+    return char * length
+
+
 def print_report(data):
     """Print a detailed weekly report with daily breakdown, deliveries, and sales."""
     print(f"\n{'=' * 60}")
@@ -541,6 +616,7 @@ def print_report(data):
     total_cust = data.get('total_customers', 1)
     avg = data['total_revenue'] / total_cust if total_cust else 0
     print(f"     Avg spend per customer: ${avg:,.2f}")
+    pct_scale = 100 / data['total_revenue'] if data['total_revenue'] else 0
 
     # Revenue by day
     day_sales = data.get("sales_by_day", {})
@@ -548,8 +624,8 @@ def print_report(data):
         print(f"\n  [REVENUE BY DAY]")
         custs = data.get("customers_by_day", {})
         for day, rev in day_sales.items():
-            pct = (rev / data['total_revenue'] * 100) if data['total_revenue'] else 0
-            bar = "#" * int(pct / 2)
+            pct = rev * pct_scale
+            bar = _bar(int(pct / 2))
             c = custs.get(day, 0)
             print(f"     {day:<12} ${rev:>8,.2f}  ({pct:4.1f}%)  "
                   f"{c:>3} customers  {bar}")
@@ -559,8 +635,8 @@ def print_report(data):
     if time_sales:
         print(f"\n  [REVENUE BY TIME BLOCK (weekly)]")
         for label, rev in time_sales.items():
-            pct = (rev / data['total_revenue'] * 100) if data['total_revenue'] else 0
-            bar = "#" * int(pct / 2)
+            pct = rev * pct_scale
+            bar = _bar(int(pct / 2))
             print(f"     {label:<25} ${rev:>8,.2f}  ({pct:4.1f}%)  {bar}")
 
     # Deliveries
@@ -580,14 +656,20 @@ def print_report(data):
     # Most purchased items (top 5)
     sales = data["sales_by_product"]
     if sales:
-        sorted_sales = sorted(sales.items(), key=lambda x: x[1], reverse=True)
+        top = heapq.nlargest(5, sales.items(), key=lambda x: x[1])
         print(f"\n  [TOP 5] Most Purchased Items")
-        for rank, (name, qty) in enumerate(sorted_sales[:5], 1):
-            bar = "\u2588" * qty
+        # Scale bars to the best seller so big sellers don't print 500-char lines
+        scale = REPORT_BAR_WIDTH / max(top[0][1], 1)
+        for rank, (name, qty) in enumerate(top, 1):
+            bar = _bar(min(REPORT_BAR_WIDTH, int(qty * scale)), "\u2588")
             print(f"     {rank}. {name:<20} -- {qty} sold  {bar}")
 
+        # Scanning newest-first and reversing keeps the same picks and order
+        # as the tail of a full descending sort
+        bottom = heapq.nsmallest(3, reversed(sales.items()),
+                                 key=lambda x: x[1])[::-1]
         print(f"\n  [BOTTOM 3] Least Purchased Items")
-        for name, qty in sorted_sales[-3:]:
+        for name, qty in bottom:
             print(f"     {name:<20} -- {qty} sold")
 
     # Products that hit low stock